@@ -21,111 +21,419 @@ For each sales representative for yesterday's data only.
 
 import sys
 import os
-from datetime import datetime
-
-# Add the current directory to the path so we can import merged.py
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-try:
-    from merged import (
-        analyze_sales_data_by_date, 
-        save_daily_sales_metrics_to_csv,
-        write_daily_data_to_master_sheet,
-        create_sheet_name_for_date,
-        should_run_analysis,
-        get_yesterday_est
+import argparse
+import logging
+import pickle
+import time
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+# Log bare messages to stdout so output matches the rest of the pipeline;
+# set LOGLEVEL=WARNING (e.g. under cron) to skip building the progress text
+logging.basicConfig(
+    level=os.environ.get("LOGLEVEL", "INFO").upper(),
+    format="%(message)s",
+    stream=sys.stdout,
+)
+log = logging.getLogger(__name__)
+
+# EST timezone (same zone merged.py uses)
+EST = ZoneInfo("America/New_York")
+
+
+def get_yesterday_est():
+    """Get yesterday's date in EST timezone"""
+    return (datetime.now(EST) - timedelta(days=1)).date()
+
+
+def is_working_day(date_obj):
+    """Check if a date is a working day (Monday-Friday)"""
+    return date_obj.weekday() < 5
+
+
+def import_merged():
+    """
+    Import the analysis functions from merged.py.
+    merged.py pulls in pandas and the Google/MySQL clients and authenticates
+    at import time, so this is only done once we know the analysis will run.
+    """
+    # merged.py lives next to this script, and Python already puts the script's
+    # directory first on sys.path, so no path manipulation is needed here.
+    try:
+        import merged
+    except ImportError as e:
+        log.error("❌ Error importing from merged.py: %s", e)
+        log.error("Make sure merged.py is in the same directory and all dependencies are installed.")
+        sys.exit(1)
+    
+    log.info("✅ Successfully imported functions from merged.py")
+    return merged
+
+# Separator lines for the run header and the summary block
+HEADER_SEPARATOR = "=" * 60
+SUMMARY_SEPARATOR = "-" * 40
+
+# Team-total metrics shown in the summary, in display order
+TEAM_TOTALS_KEYS = (
+    'New Clients Closed',
+    'New Clients Closed (Organic)',
+    'Total New Clients Closed',
+    'Total Rebuys',
+    'New Client Revenue',
+    'Rebuy Revenue',
+    'Total Revenue',
+    'Average Deal Size',
+    'Appointments Booked',
+    'Appointments Conducted',
+    'Daily Show Percentage',
+    'Running Close Rate',
+)
+
+# Fetches all TEAM_TOTALS_KEYS from a day's totals in one C-level call
+get_team_totals_values = itemgetter(*TEAM_TOTALS_KEYS)
+
+TEAM_TOTALS_TEMPLATE = "\n".join([
+    "New Clients Closed: {}",
+    "New Clients Closed (Organic): {}",
+    "Total New Clients Closed: {}",
+    "Total Rebuys: {}",
+    "New Client Revenue: ${:,.2f}",
+    "Rebuy Revenue: ${:,.2f}",
+    "Total Revenue: ${:,.2f}",
+    "Running Average Deal Size: ${:,.2f}",
+    "Appointments Booked: {}",
+    "Appointments Conducted: {}",
+    "Daily Show Percentage: {:.1f}%",
+    "Running Close Rate: {:.1f}%",
+])
+
+# Analysis results are cached per date so a rerun after a failed write
+# (e.g. a Sheets quota error) does not repeat the whole analysis. Entries are
+# dropped once the write succeeds and ignored after CACHE_TTL seconds, so
+# sales rows or Zoom recordings that land later in the day are picked up.
+CACHE_DIR = Path(".cache")
+CACHE_TTL = 60 * 60
+
+def analysis_cache_path(yesterday_str):
+    """Cache file holding the analysis result for one date"""
+    return CACHE_DIR / f"daily_{yesterday_str}.pkl"
+
+def clear_cached_analysis(yesterday_str):
+    """Drop a date's cached result (after its data was written successfully)"""
+    try:
+        analysis_cache_path(yesterday_str).unlink(missing_ok=True)
+    except OSError as e:
+        log.warning("⚠️  Could not remove cache file for %s: %s", yesterday_str, e)
+
+def run_analysis_cached(merged, target_date, yesterday_str, use_cache=True):
+    """Run analyze_sales_data_by_date(), reusing a recent cached result for the same date"""
+    cache_path = analysis_cache_path(yesterday_str)
+    
+    if use_cache and cache_path.exists():
+        try:
+            cached = pickle.loads(cache_path.read_bytes())
+            age = time.time() - cached["cached_at"]
+            if age < CACHE_TTL:
+                log.info("♻️  Loaded cached analysis results from %s", cache_path)
+                return cached["result"]
+            log.info("Ignoring stale cache file %s (%.0f minutes old)", cache_path, age / 60)
+        except Exception as e:
+            log.warning("⚠️  Ignoring unreadable cache file %s: %s", cache_path, e)
+    
+    result = merged.analyze_sales_data_by_date(target_date)
+    
+    # Only cache successful runs so an empty result is retried next time
+    if use_cache and result:
+        try:
+            CACHE_DIR.mkdir(exist_ok=True)
+            cache_path.write_bytes(pickle.dumps({"cached_at": time.time(), "result": result}))
+        except OSError as e:
+            log.warning("⚠️  Could not write cache file %s: %s", cache_path, e)
+    
+    return result
+
+def save_csv_step(merged, result):
+    """Save the CSV, logging (not raising) any failure so other steps still run"""
+    try:
+        merged.save_daily_sales_metrics_to_csv(result)
+        return True
+    except Exception as e:
+        log.exception("❌ Error saving CSV file: %s", e)
+        return False
+
+def write_sheet_step(merged, result, yesterday, yesterday_str):
+    """Write to the master sheet, logging (not raising) any failure so other steps still run"""
+    try:
+        return merged.write_daily_data_to_master_sheet(
+            result, yesterday=yesterday, yesterday_str=yesterday_str
+        )
+    except Exception as e:
+        log.exception("❌ Error writing to master sheet: %s", e)
+        return False
+
+def parse_date_arg(value):
+    """argparse type for YYYY-MM-DD dates"""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}' (expected YYYY-MM-DD)")
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Daily sales analysis for yesterday, or a set of dates to backfill"
+    )
+    parser.add_argument(
+        "--date",
+        dest="dates",
+        action="append",
+        type=parse_date_arg,
+        metavar="YYYY-MM-DD",
+        help="Date to analyze instead of yesterday (repeatable)",
+    )
+    parser.add_argument(
+        "--from",
+        dest="from_date",
+        type=parse_date_arg,
+        metavar="YYYY-MM-DD",
+        help="First date of a backfill range (requires --to)",
     )
-    print("✅ Successfully imported functions from merged.py")
-except ImportError as e:
-    print(f"❌ Error importing from merged.py: {e}")
-    print("Make sure merged.py is in the same directory and all dependencies are installed.")
-    sys.exit(1)
+    parser.add_argument(
+        "--to",
+        dest="to_date",
+        type=parse_date_arg,
+        metavar="YYYY-MM-DD",
+        help="Last date of a backfill range, inclusive (requires --from)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached analysis results and recompute from the source data",
+    )
+    args = parser.parse_args(argv)
+    
+    if (args.from_date is None) != (args.to_date is None):
+        parser.error("--from and --to must be given together")
+    if args.from_date is not None and args.from_date > args.to_date:
+        parser.error("--from must not be after --to")
+    
+    # Master sub-sheets are named without a year ("June 3"), so dates from two
+    # years would overwrite each other's sheets
+    requested = (args.dates or []) + [d for d in (args.from_date, args.to_date) if d is not None]
+    if len({d.year for d in requested}) > 1:
+        parser.error("all dates must fall in the same year (master sub-sheets are named without a year)")
+    
+    return args
 
-def main():
-    """Main function to run daily sales analysis for yesterday only"""
-    print("🚀 Starting Daily Sales Analysis for Yesterday...")
-    print("=" * 60)
+def resolve_target_dates(args):
+    """Return the sorted, de-duplicated dates to analyze (yesterday by default)"""
+    dates = set(args.dates or [])
+    
+    if args.from_date is not None:
+        day = args.from_date
+        while day <= args.to_date:
+            dates.add(day)
+            day += timedelta(days=1)
+    
+    return sorted(dates) or [get_yesterday_est()]
+
+def check_backfill_dates(merged, dates):
+    """
+    Refuse dates before the master sheet's earliest daily sub-sheet: that sheet
+    is the historical baseline for the running calculations, so writing an
+    earlier one would silently move the baseline for every later daily run.
+    """
+    if not merged.MASTER_SHEET_ID:
+        return True
+    
+    try:
+        earliest_sheet, earliest_date = merged.find_earliest_master_sheet(merged.get_master_sheets())
+    except Exception as e:
+        log.exception("❌ Could not list master sheets to check the backfill dates: %s", e)
+        return False
+    
+    if earliest_date is None:
+        return True
+    
+    too_early = [d for d in dates if d < earliest_date.date()]
+    if too_early:
+        log.error(
+            "❌ Refusing to backfill %s: before the earliest master sub-sheet '%s', "
+            "which is the running-calculation baseline",
+            ", ".join(str(d) for d in too_early), earliest_sheet,
+        )
+        return False
+    return True
+
+def backfill(dates, use_cache=True):
+    """
+    Analyze several dates in one process, reusing the imported modules and the
+    authenticated Sheets client, then write every date's sub-sheet to the
+    master sheet in a single batched request.
+    """
+    log.info("🚀 Starting Daily Sales Analysis backfill for %d date(s)...", len(dates))
+    log.info(HEADER_SEPARATOR)
+    
+    working_dates = []
+    for target_date in dates:
+        if is_working_day(target_date):
+            working_dates.append(target_date)
+        else:
+            log.info("Skipping %s (%s) - not a working day", target_date, target_date.strftime('%A'))
+    
+    if not working_dates:
+        log.info("Backfill skipped - no working days in the requested dates")
+        return
+    
+    merged = import_merged()
+    if not check_backfill_dates(merged, working_dates):
+        sys.exit(1)
+    
+    # All dates go into one CSV and one master-sheet write
+    combined = {'daily_metrics': {}, 'all_dates': []}
+    rows_by_sheet = {}
+    
+    for target_date in working_dates:
+        date_str = target_date.strftime('%Y-%m-%d')
+        log.info("\nTarget date: %s", target_date)
+        
+        try:
+            result = run_analysis_cached(merged, target_date, date_str, use_cache=use_cache)
+        except Exception as e:
+            log.exception("❌ Error during analysis for %s: %s", target_date, e)
+            continue
+        
+        if not result:
+            log.warning("❌ Analysis returned empty result for %s", target_date)
+            continue
+        
+        combined.setdefault('current_month', result.get('current_month', 'Unknown'))
+        combined.setdefault('current_year', result.get('current_year', 'Unknown'))
+        combined['all_dates'].extend(result.get('all_dates', [target_date]))
+        for rep, metrics_by_date in result['daily_metrics'].items():
+            combined['daily_metrics'].setdefault(rep, {}).update(metrics_by_date)
+        
+        sheet_name = merged.create_sheet_name_for_date(target_date)
+        rows_by_sheet[sheet_name] = merged.build_master_sheet_rows(result['daily_metrics'], date_str)
+    
+    if not rows_by_sheet:
+        log.warning("❌ No dates produced analysis results - nothing to save")
+        return
+    
+    save_csv_step(merged, combined)
+    
+    if not merged.MASTER_SHEET_ID:
+        log.warning("Warning: MASTER_SHEET_ID not found. Cannot write to master sheet.")
+        return
+    
+    log.info("\n📝 Writing %d sub-sheet(s) to master sheet: %s", len(rows_by_sheet), ", ".join(rows_by_sheet))
+    try:
+        response = merged.write_rows_to_master_sheet(rows_by_sheet)
+        log.info("  ✅ Data written successfully: %s cells updated", response.get('totalUpdatedCells', 0))
+        for target_date in working_dates:
+            clear_cached_analysis(target_date.strftime('%Y-%m-%d'))
+    except Exception as e:
+        log.exception("❌ Error writing to master sheet: %s", e)
+
+def main(yesterday=None, use_cache=True):
+    """Main function to run daily sales analysis for a single date (yesterday by default)"""
+    log.info("🚀 Starting Daily Sales Analysis for Yesterday...")
+    log.info(HEADER_SEPARATOR)
     
     # Check if yesterday was a working day
-    yesterday = get_yesterday_est()
-    print(f"Target date: {yesterday}")
+    if yesterday is None:
+        yesterday = get_yesterday_est()
+    yesterday_str = yesterday.strftime('%Y-%m-%d')
+    log.info("Target date: %s", yesterday)
     
-    if not should_run_analysis():
-        print("Analysis skipped - yesterday was not a working day")
+    # Check the weekday before importing merged.py so skipped runs stay cheap
+    if not is_working_day(yesterday):
+        log.info("❌ Yesterday (%s) was a %s - skipping analysis (only run on working days)", yesterday, yesterday.strftime('%A'))
+        log.info("Analysis skipped - yesterday was not a working day")
         return
     
+    log.info("✅ Yesterday (%s) was a working day - proceeding with analysis", yesterday)
+    merged = import_merged()
+    if yesterday != get_yesterday_est() and not check_backfill_dates(merged, [yesterday]):
+        sys.exit(1)
+    
     try:
-        # Run the analysis
-        result = analyze_sales_data_by_date()
+        # Run the analysis (or reuse today's cached result on a retry)
+        result = run_analysis_cached(merged, yesterday, yesterday_str, use_cache=use_cache)
         
         if result:
-            print("\n✅ Analysis completed successfully!")
-            
-            # Save to CSV
-            save_daily_sales_metrics_to_csv(result)
-            
-            # Write to master sheet
-            master_sheet_success = write_daily_data_to_master_sheet(result)
-            
-            # Print summary info
-            current_month = result.get('current_month', 'Unknown')
-            current_year = result.get('current_year', 'Unknown')
-            all_dates = result.get('all_dates', [])
+            log.info("\n✅ Analysis completed successfully!")
             
-            print(f"\n📊 ANALYSIS SUMMARY:")
-            print("-" * 40)
-            print(f"Period: {current_month}/{current_year}")
-            print(f"Date Processed: {yesterday}")
-            print(f"Representatives: Sierra, Mikaela, Mike")
+            # Save to CSV (local disk) and write to master sheet (network) concurrently;
+            # the two steps only read from result
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                csv_future = executor.submit(save_csv_step, merged, result)
+                sheet_future = executor.submit(
+                    write_sheet_step, merged, result, yesterday, yesterday_str
+                )
+                csv_future.result()
+                master_sheet_success = sheet_future.result()
             
-            # Show team totals summary for yesterday
-            daily_metrics = result.get('daily_metrics', {})
-            if 'TEAM_TOTALS' in daily_metrics:
-                team_totals = daily_metrics['TEAM_TOTALS']
-                yesterday_str = yesterday.strftime('%Y-%m-%d')
+            # Build the summary only if it will be shown, and emit it as one record
+            if log.isEnabledFor(logging.INFO):
+                current_month = result.get('current_month', 'Unknown')
+                current_year = result.get('current_year', 'Unknown')
                 
-                if yesterday_str in team_totals:
-                    day_data = team_totals[yesterday_str]
+                lines = [
+                    "\n📊 ANALYSIS SUMMARY:",
+                    SUMMARY_SEPARATOR,
+                    f"Period: {current_month}/{current_year}",
+                    f"Date Processed: {yesterday}",
+                    "Representatives: Sierra, Mikaela, Mike",
+                ]
+                
+                # Show team totals summary for yesterday
+                daily_metrics = result.get('daily_metrics', {})
+                team_totals = daily_metrics.get('TEAM_TOTALS')
+                if team_totals is not None:
+                    day_data = team_totals.get(yesterday_str)
                     
-                    print(f"\n🎯 TEAM TOTALS FOR YESTERDAY ({yesterday}):")
-                    print(f"New Clients Closed: {day_data['New Clients Closed']}")
-                    print(f"New Clients Closed (Organic): {day_data['New Clients Closed (Organic)']}")
-                    print(f"Total New Clients Closed: {day_data['Total New Clients Closed']}")
-                    print(f"Total Rebuys: {day_data['Total Rebuys']}")
-                    print(f"New Client Revenue: ${day_data['New Client Revenue']:,.2f}")
-                    print(f"Rebuy Revenue: ${day_data['Rebuy Revenue']:,.2f}")
-                    print(f"Total Revenue: ${day_data['Total Revenue']:,.2f}")
-                    print(f"Running Average Deal Size: ${day_data['Average Deal Size']:,.2f}")
-                    print(f"Appointments Booked: {day_data['Appointments Booked']}")
-                    print(f"Appointments Conducted: {day_data['Appointments Conducted']}")
-                    print(f"Daily Show Percentage: {day_data['Daily Show Percentage']:.1f}%")
-                    print(f"Running Close Rate: {day_data['Running Close Rate']:.1f}%")
-                else:
-                    print(f"\n⚠️  No team totals data found for yesterday ({yesterday})")
-            
-            print(f"\nDaily metrics have been calculated for yesterday ({yesterday}).")
-            print("Zero values are used for representatives with no sales data.")
-            print("Running calculations include historical data from master sheet.")
+                    if day_data is not None:
+                        lines.append(f"\n🎯 TEAM TOTALS FOR YESTERDAY ({yesterday}):")
+                        lines.append(TEAM_TOTALS_TEMPLATE.format(*get_team_totals_values(day_data)))
+                    else:
+                        lines.append(f"\n⚠️  No team totals data found for yesterday ({yesterday})")
+                
+                lines.append(f"\nDaily metrics have been calculated for yesterday ({yesterday}).")
+                lines.append("Zero values are used for representatives with no sales data.")
+                lines.append("Running calculations include historical data from master sheet.")
+                
+                log.info("%s", "\n".join(lines))
             
             if master_sheet_success:
-                print(f"✅ Data has been written to master sheet in sub-sheet: '{create_sheet_name_for_date(yesterday)}'")
+                clear_cached_analysis(yesterday_str)
+                log.info("✅ Data has been written to master sheet in sub-sheet: '%s'", merged.create_sheet_name_for_date(yesterday))
             else:
-                print(f"❌ Failed to write data to master sheet (see error above)")
-                print(f"   CSV file still contains all the data: check the most recent daily_sales_metrics_*.csv file")
+                log.error("❌ Failed to write data to master sheet (see error above)")
+                log.error("   CSV file still contains all the data: check the most recent daily_sales_metrics_*.csv file")
             
         else:
-            print("❌ Analysis returned empty result")
-            print("This could mean:")
-            print("- No sales data found for yesterday")
-            print("- Google Sheets configuration issue")
-            print("- Data formatting issue")
+            log.warning("❌ Analysis returned empty result")
+            log.warning("This could mean:")
+            log.warning("- No sales data found for yesterday")
+            log.warning("- Google Sheets configuration issue")
+            log.warning("- Data formatting issue")
             
     except Exception as e:
-        print(f"❌ Error during analysis: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("❌ Error during analysis: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
-    print(f"\n✅ Daily Sales Analysis completed for {get_yesterday_est()}!") 
\ No newline at end of file
+    args = parse_args()
+    
+    # Resolve the target date(s) once and share them with main()/backfill()
+    dates = resolve_target_dates(args)
+    if len(dates) == 1:
+        main(dates[0], use_cache=not args.no_cache)
+        log.info("\n✅ Daily Sales Analysis completed for %s!", dates[0])
+    else:
+        backfill(dates, use_cache=not args.no_cache)
+        log.info("\n✅ Daily Sales Analysis backfill completed for %s to %s!", dates[0], dates[-1])
@@ -2,7 +2,7 @@ import requests
 from datetime import datetime, timedelta, timezone, time
 import os
 from dotenv import load_dotenv
-import pytz
+from zoneinfo import ZoneInfo
 from typing import Dict, List, Tuple
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
@@ -11,9 +11,21 @@ import pandas as pd
 import re
 import mysql.connector
 from mysql.connector import Error
+from mysql.connector.pooling import MySQLConnectionPool
 import logging
 import calendar
+import traceback
 import urllib.parse
+import random
+import threading
+import bisect
+import json
+import hashlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from time import monotonic, sleep
 
 load_dotenv()
 
@@ -24,20 +36,72 @@ CALENDLY_HEADERS = {
     "Authorization": f"Bearer {CALENDLY_PAT}",
     "Content-Type": "application/json",
 }
+CALENDLY_ORG_URI = f"https://api.calendly.com/organizations/{os.getenv('ORG_UUID')}"
+# Events per scheduled_events page (Calendly's maximum; its default is 20)
+CALENDLY_PAGE_SIZE = 100
 
 # Zoom
 ZOOM_ACCOUNT_ID = os.getenv("ZOOM_ACCOUNT_ID")
 ZOOM_CLIENT_ID = os.getenv("ZOOM_CLIENT_ID")
 ZOOM_CLIENT_SECRET = os.getenv("ZOOM_CLIENT_SECRET")
+# Access tokens are reused until this many seconds before they expire, and
+# persisted (per client id) so consecutive runs don't each mint a new one
+ZOOM_TOKEN_EXPIRY_MARGIN = 60
+ZOOM_TOKEN_CACHE_FILE = os.getenv(
+    "ZOOM_TOKEN_CACHE_FILE",
+    os.path.join(
+        tempfile.gettempdir(),
+        "zoom_token_%s.json" % hashlib.sha256(str(ZOOM_CLIENT_ID).encode()).hexdigest()[:16],
+    ),
+)
+# Zoom user ids rarely change, so email -> id lookups are cached on disk for a day
+# (per Zoom account and app, since ids belong to the account)
+ZOOM_USER_ID_CACHE_TTL = 24 * 60 * 60
+ZOOM_USER_ID_CACHE_FILE = os.getenv(
+    "ZOOM_USER_ID_CACHE_FILE",
+    os.path.join(
+        tempfile.gettempdir(),
+        "zoom_user_ids_%s.json" % hashlib.sha256(
+            f"{ZOOM_ACCOUNT_ID}:{ZOOM_CLIENT_ID}".encode()
+        ).hexdigest()[:16],
+    ),
+)
 
 # Google Sheets
 SERVICE_ACCOUNT_FILE = "service-acc.json"
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 SPREADSHEET_ID = os.getenv("GOOGLE_SHEET_ID")
 MASTER_SHEET_ID = os.getenv("MASTER_SHEET_ID")
+# Retries (randomized exponential backoff) for 429/5xx responses on sheet writes
+SHEETS_NUM_RETRIES = int(os.getenv("SHEETS_NUM_RETRIES", 5))
+# How long (seconds) one read of the latest sales sheet is reused across analyses
+SALES_SHEET_CACHE_TTL = int(os.getenv("SALES_SHEET_CACHE_TTL", 300))
+# How long (seconds) the master spreadsheet's sheet list is reused
+MASTER_SHEET_CACHE_TTL = int(os.getenv("MASTER_SHEET_CACHE_TTL", 300))
+
+# Client-side rate limits (requests per period, in seconds) for each API,
+# plus how many times a 429 (or a transient 5xx on a GET) is retried with backoff
+CALENDLY_RATE_LIMIT = (5, 1)
+ZOOM_RATE_LIMIT = (10, 1)
+SLACK_RATE_LIMIT = (50, 60)
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", 5))
+HTTP_RETRY_GET_STATUSES = frozenset({500, 502, 503, 504})
+
+# Upper bound on concurrent HTTP requests fanned out per batch (invitees, reps)
+HTTP_MAX_WORKERS = int(os.getenv("HTTP_MAX_WORKERS", 8))
+# Seconds to wait for an API to connect/respond before giving up on a request
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 30))
+
+# Print per-candidate/per-item details while fetching and matching Calendly
+# events and Zoom recordings (summaries and per-event outcomes always print)
+DEBUG = os.getenv("DEBUG", "").lower() in ("1", "true", "yes")
 
 # Slack
 SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN")
+SLACK_HEADERS = {
+    "Authorization": f"Bearer {SLACK_BOT_TOKEN}",
+    "Content-Type": "application/json",
+}
 SLACK_USERS = {
     "vinamr": "U08U7SSR17U",
     # "nick": "U08UV8RB1K2"
@@ -51,6 +115,8 @@ DB_CONFIG = {
     'password': os.getenv('DB_PASSWORD', 'your_password'),
     'port': int(os.getenv('DB_PORT', 3306))
 }
+# Connections kept open in the pool; close() on a pooled connection returns it
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 5))
 
 # User mappings for Calendly/Zoom
 USER_MAPPINGS = {
@@ -69,7 +135,7 @@ USER_MAPPINGS = {
 }
 
 # EST timezone
-EST = pytz.timezone("America/New_York")
+EST = ZoneInfo("America/New_York")
 
 # Initialize Google Sheets client
 credentials = service_account.Credentials.from_service_account_file(
@@ -81,6 +147,51 @@ sheet = service.spreadsheets()
 # Global storage for all metrics
 daily_metrics = {}
 
+# Per-rep results one analysis leaves for the next (close rate, deal size)
+run_state = {
+    "user_appointments_conducted": {},
+    "new_clients_counts": {},
+    "new_client_revenue_grouped": {},
+}
+
+# Banner line printed around each processing section
+SECTION_SEPARATOR = "=" * 80
+
+# Precompiled patterns for column-name normalization and sheet-name dates
+_WS_RE = re.compile(r"\s+")
+_DATE_RANGE_RE = re.compile(r"([A-Za-z]+)\s+(\d+)\s*-\s*([A-Za-z]+)\s+(\d+)")
+_DATE_SINGLE_RE = re.compile(r"([A-Za-z]+)\s+(\d+)")
+
+# Precompiled patterns for transcript speaker and join/leave detection
+_SPEAKER_RE = re.compile(r'^([^:]+):', re.MULTILINE)
+_DIGITS_RE = re.compile(r'\d+')
+_JOIN_LEAVE_RES = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(\w+(?:\s+\w+)*)\s+joined\s+the\s+meeting",
+        r"(\w+(?:\s+\w+)*)\s+left\s+the\s+meeting",
+        r"(\w+(?:\s+\w+)*)\s+has\s+joined\s+the\s+meeting",
+        r"(\w+(?:\s+\w+)*)\s+has\s+left\s+the\s+meeting",
+    )
+]
+
+# "Demo By" names counted toward each rep's calculated sales metrics (exact match)
+SALES_REP_NAME_VARIANTS = {
+    'sierra': ('sierra', 'sierra campbell', 'sierrac'),
+    'mikaela': ('mikaela', 'mikaela gordon'),
+    'mike': ('mike', 'mike hammer', 'hammer'),
+}
+SALES_NAME_VARIANT_TO_REP = {
+    variant: rep for rep, variants in SALES_REP_NAME_VARIANTS.items() for variant in variants
+}
+
+# Columns the sales sheets must provide (matched loosely by map_required_columns)
+SALES_REQUIRED_COLUMNS = ("Demo By", "ORGANIC?", "REBUY?", "Deal Amount")
+DAILY_SALES_REQUIRED_COLUMNS = ("Date",) + SALES_REQUIRED_COLUMNS
+
+# Translation table that deletes currency symbols and thousands separators
+_CURRENCY_STRIP = str.maketrans("", "", "₹$,")
+
 # --- WORKING DAY FUNCTIONS ---
 def is_working_day(date_obj):
     """Check if a date is a working day (Monday-Friday)"""
@@ -91,9 +202,20 @@ def get_yesterday_est():
     """Get yesterday's date in EST timezone"""
     return (datetime.now(EST) - timedelta(days=1)).date()
 
-def should_run_analysis():
+@lru_cache(maxsize=64)
+def est_day_bounds_utc(start_date, end_date=None):
+    """
+    UTC datetimes for 00:00:00 EST on start_date and 23:59:59 EST on end_date
+    (defaults to start_date). Cached, so each rep's fetchers share one conversion.
+    """
+    start_est = datetime.combine(start_date, time(0, 0, 0), tzinfo=EST)
+    end_est = datetime.combine(end_date or start_date, time(23, 59, 59), tzinfo=EST)
+    return start_est.astimezone(timezone.utc), end_est.astimezone(timezone.utc)
+
+def should_run_analysis(yesterday=None):
     """Check if analysis should run - only if yesterday was a working day"""
-    yesterday = get_yesterday_est()
+    if yesterday is None:
+        yesterday = get_yesterday_est()
     if is_working_day(yesterday):
         print(f"✅ Yesterday ({yesterday}) was a working day - proceeding with analysis")
         return True
@@ -103,15 +225,28 @@ def should_run_analysis():
         return False
 
 # --- DATABASE FUNCTIONS ---
+_db_pool = None
+_db_pool_lock = threading.Lock()
+
+
 def get_db_connection():
-    """Create and return a database connection"""
+    """Return a pooled database connection (the pool is created on first use)"""
+    global _db_pool
     try:
-        connection = mysql.connector.connect(**DB_CONFIG)
+        with _db_pool_lock:
+            if _db_pool is None:
+                _db_pool = MySQLConnectionPool(
+                    pool_name="daily_metrics", pool_size=DB_POOL_SIZE, **DB_CONFIG
+                )
+        connection = _db_pool.get_connection()
         if connection.is_connected():
             return connection
+        # Hand the dead connection back so it doesn't hold a pool slot
+        connection.close()
+        print("Error connecting to MySQL: pooled connection is not connected")
     except Error as e:
         print(f"Error connecting to MySQL: {e}")
-        return None
+    return None
 
 def create_daily_metrics_table():
     """Create the daily_metrics table if it doesn't exist"""
@@ -119,6 +254,7 @@ def create_daily_metrics_table():
     if not connection:
         return False
 
+    cursor = None
     try:
         cursor = connection.cursor()
 
@@ -146,31 +282,40 @@ def create_daily_metrics_table():
         print(f"❌ Error creating daily metrics table: {e}")
         return False
     finally:
-        if connection.is_connected():
+        if cursor is not None and connection.is_connected():
             cursor.close()
-            connection.close()
+        connection.close()  # returns the connection to the pool
+
+METRIC_UPSERT_QUERY = """
+INSERT INTO daily_metrics (metric_date, representative, metric_name, metric_value, metric_type, source)
+VALUES (%s, %s, %s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE
+    metric_value = VALUES(metric_value),
+    metric_type = VALUES(metric_type),
+    source = VALUES(source),
+    updated_at = CURRENT_TIMESTAMP
+"""
 
-def insert_metric(metric_date, representative, metric_name, metric_value, metric_type='count', source=None):
-    """Insert or update a single metric"""
-    connection = get_db_connection()
+
+def build_metric_row(metric_date, representative, metric_name, metric_value, metric_type='count', source=None):
+    """Return the parameter tuple for METRIC_UPSERT_QUERY"""
+    return (metric_date, representative, metric_name, metric_value, metric_type, source)
+
+
+def insert_metric(metric_date, representative, metric_name, metric_value, metric_type='count', source=None, connection=None):
+    """Insert or update a single metric (on the given connection, or a pooled one)"""
+    owns_connection = connection is None
+    if owns_connection:
+        connection = get_db_connection()
     if not connection:
         return False
 
+    cursor = None
     try:
         cursor = connection.cursor()
 
-        query = """
-        INSERT INTO daily_metrics (metric_date, representative, metric_name, metric_value, metric_type, source)
-        VALUES (%s, %s, %s, %s, %s, %s)
-        ON DUPLICATE KEY UPDATE
-            metric_value = VALUES(metric_value),
-            metric_type = VALUES(metric_type),
-            source = VALUES(source),
-            updated_at = CURRENT_TIMESTAMP
-        """
-
-        values = (metric_date, representative, metric_name, metric_value, metric_type, source)
-        cursor.execute(query, values)
+        values = build_metric_row(metric_date, representative, metric_name, metric_value, metric_type, source)
+        cursor.execute(METRIC_UPSERT_QUERY, values)
         connection.commit()
 
         return True
@@ -179,8 +324,9 @@ def insert_metric(metric_date, representative, metric_name, metric_value, metric
         print(f"❌ Error inserting metric {metric_name} for {representative}: {e}")
         return False
     finally:
-        if connection.is_connected():
+        if cursor is not None and connection.is_connected():
             cursor.close()
+        if owns_connection:
             connection.close()
 
 def save_all_metrics_to_db():
@@ -189,38 +335,151 @@ def save_all_metrics_to_db():
 
     print(f"\n💾 Saving all metrics to database for {yesterday}...")
 
-    total_saved = 0
-    for rep_name in ['sierra', 'mikaela', 'mike']:
-        rep_metrics = daily_metrics.get(rep_name, {})
+    rows = [
+        build_metric_row(
+            yesterday,
+            rep_name,
+            metric_name,
+            metric_data['value'],
+            metric_data['type'],
+            metric_data['source'],
+        )
+        for rep_name in ['sierra', 'mikaela', 'mike']
+        for metric_name, metric_data in daily_metrics.get(rep_name, {}).items()
+    ]
+    if not rows:
+        print("\n✅ Total metrics saved: 0")
+        return
 
-        for metric_name, metric_data in rep_metrics.items():
-            success = insert_metric(
-                yesterday,
-                rep_name,
-                metric_name,
-                metric_data['value'],
-                metric_data['type'],
-                metric_data['source']
-            )
-            if success:
-                total_saved += 1
-                print(f"  ✅ {rep_name}: {metric_name} = {metric_data['value']} ({metric_data['type']})")
-            else:
-                print(f"  ❌ {rep_name}: Failed to save {metric_name}")
+    # One pooled connection, one batched upsert and one commit for the whole save
+    connection = get_db_connection()
+    if not connection:
+        print(f"❌ Could not connect to database - {len(rows)} metrics not saved")
+        return
 
-    print(f"\n✅ Total metrics saved: {total_saved}")
+    cursor = None
+    try:
+        cursor = connection.cursor()
+        cursor.executemany(METRIC_UPSERT_QUERY, rows)
+        connection.commit()
+    except Error as e:
+        print(f"❌ Error saving {len(rows)} metrics: {e}")
+        return
+    finally:
+        if cursor is not None and connection.is_connected():
+            cursor.close()
+        connection.close()
 
-def store_metric(representative, metric_name, value, metric_type='count', source=None):
-    """Store a metric in the global metrics dictionary"""
-    if representative not in daily_metrics:
-        daily_metrics[representative] = {}
+    for _, rep_name, metric_name, value, metric_type, _ in rows:
+        print(f"  ✅ {rep_name}: {metric_name} = {value} ({metric_type})")
 
-    daily_metrics[representative][metric_name] = {
+    print(f"\n✅ Total metrics saved: {len(rows)}")
+
+def store_metric(representative, metric_name, value, metric_type='count', source=None):
+    """Store a metric in the global metrics dictionary (a later store of the same metric replaces it)"""
+    daily_metrics.setdefault(representative, {})[metric_name] = {
         'value': float(value),
         'type': metric_type,
         'source': source
     }
 
+
+def store_metrics_bulk(representative, metrics, source=None):
+    """Store several {metric_name: (value, metric_type)} metrics from one source in a single update"""
+    daily_metrics.setdefault(representative, {}).update({
+        metric_name: {'value': float(value), 'type': metric_type, 'source': source}
+        for metric_name, (value, metric_type) in metrics.items()
+    })
+
+# --- HTTP FUNCTIONS ---
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` requests per `period` seconds"""
+
+    def __init__(self, rate, period=1.0):
+        self.capacity = float(rate)
+        self.fill_rate = rate / period
+        self.tokens = float(rate)
+        self.updated_at = monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request slot is available, then take it"""
+        while True:
+            with self.lock:
+                now = monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated_at) * self.fill_rate,
+                )
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = (1 - self.tokens) / self.fill_rate
+            sleep(wait)
+
+
+CALENDLY_RATE_LIMITER = RateLimiter(*CALENDLY_RATE_LIMIT)
+ZOOM_RATE_LIMITER = RateLimiter(*ZOOM_RATE_LIMIT)
+SLACK_RATE_LIMITER = RateLimiter(*SLACK_RATE_LIMIT)
+
+
+def create_http_session(headers=None):
+    """
+    Session whose connection pool keeps up to HTTP_MAX_WORKERS sockets alive
+    per host; `headers` (e.g. a static Authorization) are sent on every request
+    """
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=HTTP_MAX_WORKERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# One keep-alive session per API, keyed by that API's rate limiter, so
+# connections (and their TLS handshakes) are reused across requests. Zoom's
+# bearer token rotates, so its Authorization header stays per request.
+HTTP_SESSIONS = {
+    CALENDLY_RATE_LIMITER: create_http_session(CALENDLY_HEADERS),
+    ZOOM_RATE_LIMITER: create_http_session(),
+    SLACK_RATE_LIMITER: create_http_session(SLACK_HEADERS),
+}
+
+
+def rate_limited_request(limiter, method, url, **kwargs):
+    """
+    Send an HTTP request on the API's shared session once `limiter` allows it.
+    429 responses (and transient 5xx responses to GETs, which are safe to
+    repeat) are retried with jittered exponential backoff, honouring
+    Retry-After when present. Requests time out after HTTP_TIMEOUT seconds
+    unless a `timeout` is passed.
+    """
+    session = HTTP_SESSIONS[limiter]
+    kwargs.setdefault("timeout", HTTP_TIMEOUT)
+    for attempt in range(HTTP_MAX_RETRIES + 1):
+        limiter.acquire()
+        response = session.request(method, url, **kwargs)
+
+        retryable = response.status_code == 429 or (
+            method == "GET" and response.status_code in HTTP_RETRY_GET_STATUSES
+        )
+        if not retryable or attempt == HTTP_MAX_RETRIES:
+            return response
+
+        try:
+            delay = float(response.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            delay = min(60, 2 ** attempt) * (0.5 + random.random() / 2)
+
+        reason = "Rate limited" if response.status_code == 429 else f"HTTP {response.status_code}"
+        print(f"    {reason} from {urllib.parse.urlparse(url).netloc} - retrying in {delay:.1f}s")
+        sleep(delay)
+
+
 # --- SLACK FUNCTIONS ---
 def send_slack_message(user_id, message):
     """Send a message to a specific Slack user"""
@@ -229,11 +488,6 @@ def send_slack_message(user_id, message):
         return False
 
     url = "https://slack.com/api/chat.postMessage"
-    headers = {
-        "Authorization": f"Bearer {SLACK_BOT_TOKEN}",
-        "Content-Type": "application/json",
-    }
-
     payload = {
         "channel": user_id,
         "text": message,
@@ -241,7 +495,7 @@ def send_slack_message(user_id, message):
     }
 
     try:
-        response = requests.post(url, headers=headers, json=payload)
+        response = rate_limited_request(SLACK_RATE_LIMITER, "POST", url, json=payload)
         response.raise_for_status()
         result = response.json()
 
@@ -256,26 +510,35 @@ def send_slack_message(user_id, message):
         return False
 
 
-def broadcast_to_slack_users(message):
-    """Send message to all configured Slack users"""
+def send_slack_messages(user_id, messages):
+    """Send messages to one Slack user in order; returns a success flag per message"""
+    return [send_slack_message(user_id, message) for message in messages]
+
+
+def broadcast_to_slack_users(*messages):
+    """
+    Send one or more messages to all configured Slack users.
+    Users are messaged concurrently; each user still receives the messages in order.
+    """
     print(f"\n📤 Sending to Slack users...")
 
-    for username, user_id in SLACK_USERS.items():
-        success = send_slack_message(user_id, message)
-        if success:
-            print(f"✅ Message sent to {username}")
-        else:
-            print(f"❌ Failed to send message to {username}")
+    with ThreadPoolExecutor(max_workers=min(HTTP_MAX_WORKERS, len(SLACK_USERS) or 1)) as executor:
+        results = executor.map(
+            send_slack_messages, SLACK_USERS.values(), [messages] * len(SLACK_USERS)
+        )
+
+        for username, successes in zip(SLACK_USERS, results):
+            for success in successes:
+                if success:
+                    print(f"✅ Message sent to {username}")
+                else:
+                    print(f"❌ Failed to send message to {username}")
 
 
 # --- UTILITY FUNCTIONS ---
 def is_empty_or_null(value):
     """Check if a value is empty, null, or whitespace only"""
-    if value is None:
-        return True
-    if isinstance(value, str) and value.strip() == "":
-        return True
-    return False
+    return value is None or (isinstance(value, str) and not value.strip())
 
 
 def has_value(value):
@@ -283,85 +546,133 @@ def has_value(value):
     return not is_empty_or_null(value)
 
 
+@lru_cache(maxsize=4096)
+def normalize_name(name):
+    """Normalize a rep name for lookups ("Sierra Campbell " -> "sierra campbell")"""
+    return str(name or "").strip().lower()
+
+
+@lru_cache(maxsize=4096)
 def parse_currency_value(value):
     """Parse currency value and return float"""
+    if isinstance(value, (int, float)):
+        return float(value)
     if is_empty_or_null(value):
         return 0.0
 
-    # Convert to string and clean up
-    str_value = str(value).strip()
-
-    # Remove currency symbols and commas
-    cleaned_value = (
-        str_value.replace("₹", "").replace("$", "").replace(",", "").strip()
-    )
-
+    # Remove currency symbols and commas in one pass (float() ignores surrounding whitespace)
     try:
-        return float(cleaned_value)
+        return float(str(value).translate(_CURRENCY_STRIP))
     except (ValueError, TypeError):
         return 0.0
 
 
 def parse_numeric_value(value):
     """Parse numeric value and return float"""
+    if isinstance(value, (int, float)):
+        return float(value)
     if is_empty_or_null(value):
         return 0.0
 
-    # Convert to string and clean up
-    str_value = str(value).strip()
-
+    # float() ignores surrounding whitespace, so no strip() is needed
     try:
-        return float(str_value)
+        return float(str(value))
     except (ValueError, TypeError):
         return 0.0
 
 
+def parse_numeric_series(series):
+    """Vectorized parse_numeric_value for a whole column (non-numeric/empty -> 0.0)"""
+    return pd.to_numeric(series.astype(str).str.strip(), errors="coerce").fillna(0.0)
+
+
+def parse_currency_series(series):
+    """Vectorized parse_currency_value for a whole column (non-numeric/empty -> 0.0)"""
+    cleaned = series.astype(str).str.replace(r"[₹$,]", "", regex=True).str.strip()
+    return pd.to_numeric(cleaned, errors="coerce").fillna(0.0)
+
+
+def parse_percentage_series(series):
+    """Vectorized parse_percentage_value for a whole column (non-numeric/empty -> 0.0)"""
+    cleaned = series.astype(str).str.replace("%", "", regex=False).str.strip()
+    return pd.to_numeric(cleaned, errors="coerce").fillna(0.0)
+
+
+def sheet_values_to_dataframe(values):
+    """
+    Build a DataFrame from Sheets API rows, using the first row as headers.
+    Rows (and the header) are ragged because the API trims trailing empty
+    cells; pandas pads them to the widest row and the gaps become "".
+    """
+    df = pd.DataFrame(values).fillna("")
+    df.columns = list(df.iloc[0])
+    return df.iloc[1:].reset_index(drop=True)
+
+
+def empty_mask(series):
+    """Vectorized is_empty_or_null for a whole column (True where null or whitespace only)"""
+    return series.isna() | series.astype(str).str.strip().eq("")
+
+
 def parse_percentage_value(value):
     """Parse percentage value and return float (without % sign)"""
+    if isinstance(value, (int, float)):
+        return float(value)
     if is_empty_or_null(value):
         return 0.0
 
-    # Convert to string and clean up
-    str_value = str(value).strip()
-
-    # Remove % sign if present
-    cleaned_value = str_value.replace("%", "").strip()
-
+    # Remove % sign if present (float() ignores surrounding whitespace)
     try:
-        return float(cleaned_value)
+        return float(str(value).replace("%", ""))
     except (ValueError, TypeError):
         return 0.0
 
 
+# Bound format methods for the master sheet's currency/percentage cells
+format_currency = "${:,.2f}".format
+format_percentage = "{:.2f}%".format
+
+
+@lru_cache(maxsize=1024)
 def normalize_column_name(col_name):
     """Normalize column name by removing extra spaces, special characters, and converting to lowercase"""
     if not col_name:
         return ""
 
-    # Convert to string and strip
-    normalized = str(col_name).strip()
+    # Collapse runs of whitespace into a single space, then lowercase
+    return _WS_RE.sub(" ", str(col_name).strip()).lower()
+
+
+def build_column_index(available_columns):
+    """
+    Normalize available columns once into ({normalized: col}, {normalized_no_spaces: col}).
+    The first column wins when several normalize to the same name.
+    """
+    norm_map = {}
+    for col in available_columns:
+        norm_map.setdefault(normalize_column_name(col), col)
 
-    # Remove extra spaces and special characters, keep only alphanumeric and basic punctuation
-    normalized = re.sub(
-        r"\s+", " ", normalized
-    )  # Replace multiple spaces with single space
-    normalized = normalized.lower()
+    nospace_map = {}
+    for col_normalized, col in norm_map.items():
+        nospace_map.setdefault(col_normalized.replace(" ", ""), col)
 
-    return normalized
+    return norm_map, nospace_map
 
 
-def find_matching_column(target_column, available_columns):
-    """Find the best matching column name from available columns"""
+def find_matching_column(target_column, available_columns, column_index=None):
+    """
+    Find the best matching column name from available columns.
+    column_index: result of build_column_index(available_columns), built if not given
+    """
+    norm_map, nospace_map = column_index or build_column_index(available_columns)
     target_normalized = normalize_column_name(target_column)
 
     # First try exact match after normalization
-    for col in available_columns:
-        if normalize_column_name(col) == target_normalized:
-            return col
+    if target_normalized in norm_map:
+        return norm_map[target_normalized]
 
     # Then try partial matches
-    for col in available_columns:
-        col_normalized = normalize_column_name(col)
+    for col_normalized, col in norm_map.items():
         if (
             target_normalized in col_normalized
             or col_normalized in target_normalized
@@ -369,25 +680,32 @@ def find_matching_column(target_column, available_columns):
             return col
 
     # Try without spaces
-    target_no_spaces = target_normalized.replace(" ", "")
-    for col in available_columns:
-        col_no_spaces = normalize_column_name(col).replace(" ", "")
-        if target_no_spaces == col_no_spaces:
-            return col
+    return nospace_map.get(target_normalized.replace(" ", ""))
 
-    return None
+
+@lru_cache(maxsize=32)
+def match_required_columns(available_columns, required_columns):
+    """
+    Match each required column against a header layout (both tuples).
+    Cached, since every sheet with the same headers maps the same way.
+    Returns a tuple of (required_column, matched_column or None).
+    """
+    column_index = build_column_index(available_columns)
+    return tuple(
+        (req_col, find_matching_column(req_col, available_columns, column_index))
+        for req_col in required_columns
+    )
 
 
 def map_required_columns(df, required_columns):
     """Map required columns to actual column names in the DataFrame"""
     column_mapping = {}
-    available_columns = list(df.columns)
+    available_columns = tuple(df.columns)
 
     print(f"\nColumn Mapping:")
-    print(f"Available columns: {available_columns}")
+    print(f"Available columns: {list(available_columns)}")
 
-    for req_col in required_columns:
-        matched_col = find_matching_column(req_col, available_columns)
+    for req_col, matched_col in match_required_columns(available_columns, tuple(required_columns)):
         if matched_col:
             column_mapping[req_col] = matched_col
             print(f"✅ '{req_col}' -> '{matched_col}'")
@@ -398,19 +716,63 @@ def map_required_columns(df, required_columns):
 
 
 # --- ZOOM FUNCTIONS ---
+_zoom_token_cache = {"access_token": None, "expires_at": 0.0}
+_zoom_token_lock = threading.Lock()
+
+
+def load_zoom_token_cache():
+    """Load a previously saved Zoom token from disk (empty dict if unavailable)"""
+    try:
+        with open(ZOOM_TOKEN_CACHE_FILE) as f:
+            cached = json.load(f)
+        return {
+            "access_token": cached["access_token"],
+            "expires_at": float(cached["expires_at"]),
+        }
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def save_zoom_token_cache(access_token, expires_at):
+    """Persist the Zoom token to disk, readable only by the current user"""
+    try:
+        fd = os.open(ZOOM_TOKEN_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"access_token": access_token, "expires_at": expires_at}, f)
+    except OSError as e:
+        print(f"Warning: could not cache Zoom token: {e}")
+
+
 def get_zoom_access_token():
-    """Get OAuth access token for Zoom API"""
-    token_url = "https://zoom.us/oauth/token"
-    data = {
-        "grant_type": "account_credentials",
-        "account_id": ZOOM_ACCOUNT_ID,
-        "client_id": ZOOM_CLIENT_ID,
-        "client_secret": ZOOM_CLIENT_SECRET,
-    }
+    """Get OAuth access token for Zoom API, reusing a cached token until it expires"""
+    with _zoom_token_lock:
+        now = datetime.now(timezone.utc).timestamp()
+
+        if _zoom_token_cache["access_token"] is None:
+            _zoom_token_cache.update(load_zoom_token_cache())
+
+        if _zoom_token_cache["access_token"] and now < _zoom_token_cache["expires_at"]:
+            return _zoom_token_cache["access_token"]
+
+        token_url = "https://zoom.us/oauth/token"
+        data = {
+            "grant_type": "account_credentials",
+            "account_id": ZOOM_ACCOUNT_ID,
+            "client_id": ZOOM_CLIENT_ID,
+            "client_secret": ZOOM_CLIENT_SECRET,
+        }
+
+        response = rate_limited_request(ZOOM_RATE_LIMITER, "POST", token_url, data=data)
+        response.raise_for_status()
+        token_data = response.json()
+
+        access_token = token_data["access_token"]
+        expires_at = now + token_data.get("expires_in", 3600) - ZOOM_TOKEN_EXPIRY_MARGIN
 
-    response = requests.post(token_url, data=data)
-    response.raise_for_status()
-    return response.json()["access_token"]
+        _zoom_token_cache.update(access_token=access_token, expires_at=expires_at)
+        save_zoom_token_cache(access_token, expires_at)
+
+        return access_token
 
 
 def get_zoom_recording_transcript(meeting_uuid, access_token):
@@ -422,7 +784,7 @@ def get_zoom_recording_transcript(meeting_uuid, access_token):
     }
     
     try:
-        response = requests.get(url, headers=headers)
+        response = rate_limited_request(ZOOM_RATE_LIMITER, "GET", url, headers=headers)
         response.raise_for_status()
         data = response.json()
         
@@ -442,7 +804,7 @@ def get_zoom_recording_transcript(meeting_uuid, access_token):
             
         # Download the transcript
         print(f"      Downloading transcript for meeting {meeting_uuid}")
-        transcript_response = requests.get(download_url, headers=headers)
+        transcript_response = rate_limited_request(ZOOM_RATE_LIMITER, "GET", download_url, headers=headers)
         transcript_response.raise_for_status()
         
         transcript_content = transcript_response.text
@@ -470,12 +832,11 @@ def check_transcript_for_participants(transcript_content, sales_rep_name):
         return False
     
     # Look for speaker patterns like "Name:" at the start of lines
-    import re
-    speaker_patterns = re.findall(r'^([^:]+):', transcript_content, re.MULTILINE)
+    speaker_patterns = _SPEAKER_RE.findall(transcript_content)
     unique_speakers = set()
     for speaker in speaker_patterns:
         # Clean up speaker name (remove timestamps, etc.)
-        clean_speaker = re.sub(r'\d+', '', speaker).strip()
+        clean_speaker = _DIGITS_RE.sub('', speaker).strip()
         if clean_speaker and len(clean_speaker) > 1:
             unique_speakers.add(clean_speaker.lower())
     
@@ -489,28 +850,65 @@ def check_transcript_for_participants(transcript_content, sales_rep_name):
         return False
 
 
+_zoom_user_id_cache = None
+_zoom_user_id_lock = threading.Lock()
+
+
+def load_zoom_user_id_cache():
+    """Load {email: {"id", "cached_at"}} from disk (empty dict if unavailable)"""
+    try:
+        with open(ZOOM_USER_ID_CACHE_FILE) as f:
+            cached = json.load(f)
+        return cached if isinstance(cached, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_zoom_user_id_cache(cache):
+    """Persist the email -> Zoom user id cache to disk, readable only by the current user"""
+    try:
+        fd = os.open(ZOOM_USER_ID_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"Warning: could not cache Zoom user ids: {e}")
+
+
 def get_zoom_user_id_by_email(email, access_token):
-    """Get Zoom user ID by email address"""
+    """Get Zoom user ID by email address, cached for ZOOM_USER_ID_CACHE_TTL seconds"""
+    global _zoom_user_id_cache
+
+    now = datetime.now(timezone.utc).timestamp()
+    with _zoom_user_id_lock:
+        if _zoom_user_id_cache is None:
+            _zoom_user_id_cache = load_zoom_user_id_cache()
+        cached = _zoom_user_id_cache.get(email)
+        if cached and now - cached.get("cached_at", 0) < ZOOM_USER_ID_CACHE_TTL:
+            return cached.get("id")
+
     headers = {"Authorization": f"Bearer {access_token}"}
     url = f"https://api.zoom.us/v2/users/{email}"
 
     try:
-        response = requests.get(url, headers=headers)
+        response = rate_limited_request(ZOOM_RATE_LIMITER, "GET", url, headers=headers)
         response.raise_for_status()
-        return response.json().get("id")
+        user_id = response.json().get("id")
     except Exception as e:
         print(f"Error fetching Zoom user by email: {e}")
         return None
 
+    if user_id:
+        with _zoom_user_id_lock:
+            _zoom_user_id_cache[email] = {"id": user_id, "cached_at": now}
+            save_zoom_user_id_cache(_zoom_user_id_cache)
+
+    return user_id
+
 
 def get_zoom_meetings_for_date_range(user_id, email, access_token, start_date, end_date):
     """Get Zoom RECORDINGS for a user for a specific date range in EST."""
     # Convert to UTC for API call (Zoom API expects UTC dates)
-    start_date_est = EST.localize(datetime.combine(start_date, time(0, 0, 0)))
-    end_date_est = EST.localize(datetime.combine(end_date, time(23, 59, 59)))
-
-    start_date_utc = start_date_est.astimezone(pytz.UTC)
-    end_date_utc = end_date_est.astimezone(pytz.UTC)
+    start_date_utc, end_date_utc = est_day_bounds_utc(start_date, end_date)
 
     print(f"    Fetching Zoom recordings for {email} from {start_date} to {end_date} (EST)")
 
@@ -524,7 +922,7 @@ def get_zoom_meetings_for_date_range(user_id, email, access_token, start_date, e
     meetings = []
 
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = rate_limited_request(ZOOM_RATE_LIMITER, "GET", url, headers=headers, params=params)
         response.raise_for_status()
         data = response.json()
 
@@ -534,34 +932,11 @@ def get_zoom_meetings_for_date_range(user_id, email, access_token, start_date, e
             start_time_str = meeting.get("start_time")
             if start_time_str:
                 try:
-                    # Zoom returns UTC time
-                    if start_time_str.endswith("Z"):
-                        start_time_utc = datetime.fromisoformat(
-                            start_time_str.replace("Z", "+00:00")
-                        )
-                    else:
-                        start_time_utc = datetime.fromisoformat(start_time_str)
-                        if start_time_utc.tzinfo is None:
-                            start_time_utc = pytz.UTC.localize(start_time_utc)
-
-                    start_time_est = start_time_utc.astimezone(EST)
+                    start_time_est = parse_zoom_start_time(start_time_str)
 
                     # Check if meeting is within date range in EST
                     if start_date <= start_time_est.date() <= end_date:
-                        meeting_info = {
-                            "id": meeting.get("uuid", meeting.get("id")),
-                            "topic": meeting.get("topic"),
-                            "start_time": start_time_est,
-                            "start_time_str": start_time_est.strftime(
-                                "%I:%M %p EST"
-                            ),
-                            "has_recordings": len(
-                                meeting.get("recording_files", [])
-                            )
-                            > 0,
-                            "raw_meeting_data": meeting,  # Store for transcript checking
-                        }
-                        meetings.append(meeting_info)
+                        meetings.append(zoom_meeting_info(meeting, start_time_est))
 
                 except Exception as e:
                     print(
@@ -578,15 +953,10 @@ def get_zoom_meetings_for_date_range(user_id, email, access_token, start_date, e
 def get_zoom_meetings_for_user_today(user_id, email, access_token):
     """Get Zoom RECORDINGS for a user for yesterday in EST."""
     # Get yesterday's date in EST
-    now_est = datetime.now(EST)
-    yesterday_est = (now_est - timedelta(days=1)).date()
+    yesterday_est = get_yesterday_est()
 
     # Convert to UTC for API call (Zoom API expects UTC dates)
-    start_date_est = EST.localize(datetime.combine(yesterday_est, time(0, 0, 0)))
-    end_date_est = EST.localize(datetime.combine(yesterday_est, time(23, 59, 59)))
-
-    start_date_utc = start_date_est.astimezone(pytz.UTC)
-    end_date_utc = end_date_est.astimezone(pytz.UTC)
+    start_date_utc, end_date_utc = est_day_bounds_utc(yesterday_est)
 
     print(f"  Fetching Zoom recordings for {email} on {yesterday_est} (EST)")
     print(
@@ -603,7 +973,7 @@ def get_zoom_meetings_for_user_today(user_id, email, access_token):
     meetings = []
 
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = rate_limited_request(ZOOM_RATE_LIMITER, "GET", url, headers=headers, params=params)
         response.raise_for_status()
         data = response.json()
 
@@ -613,37 +983,15 @@ def get_zoom_meetings_for_user_today(user_id, email, access_token):
             start_time_str = meeting.get("start_time")
             if start_time_str:
                 try:
-                    # Zoom returns UTC time
-                    if start_time_str.endswith("Z"):
-                        start_time_utc = datetime.fromisoformat(
-                            start_time_str.replace("Z", "+00:00")
-                        )
-                    else:
-                        start_time_utc = datetime.fromisoformat(start_time_str)
-                        if start_time_utc.tzinfo is None:
-                            start_time_utc = pytz.UTC.localize(start_time_utc)
-
-                    start_time_est = start_time_utc.astimezone(EST)
+                    start_time_est = parse_zoom_start_time(start_time_str)
 
                     # Check if meeting is yesterday in EST
                     if start_time_est.date() == yesterday_est:
-                        meeting_info = {
-                            "id": meeting.get("uuid", meeting.get("id")),
-                            "topic": meeting.get("topic"),
-                            "start_time": start_time_est,
-                            "start_time_str": start_time_est.strftime(
-                                "%I:%M %p EST"
-                            ),
-                            "has_recordings": len(
-                                meeting.get("recording_files", [])
+                        meetings.append(zoom_meeting_info(meeting, start_time_est))
+                        if DEBUG:
+                            print(
+                                f"    Added recording: {meeting.get('topic')} at {start_time_est.strftime('%I:%M %p EST')}"
                             )
-                            > 0,
-                            "raw_meeting_data": meeting,  # Store for transcript checking
-                        }
-                        meetings.append(meeting_info)
-                        print(
-                            f"    Added recording: {meeting.get('topic')} at {start_time_est.strftime('%I:%M %p EST')}"
-                        )
 
                 except Exception as e:
                     print(
@@ -658,11 +1006,37 @@ def get_zoom_meetings_for_user_today(user_id, email, access_token):
 
 
 # --- CALENDLY FUNCTIONS ---
+EVENT_TIME_FORMAT = "%I:%M %p EST"
+
+
+def parse_event_time(iso_time_str):
+    """Parse ISO time string into an EST datetime."""
+    return datetime.fromisoformat(iso_time_str.replace("Z", "+00:00")).astimezone(EST)
+
+
 def format_event_time(iso_time_str):
     """Format ISO time string to readable format in EST timezone."""
-    dt = datetime.fromisoformat(iso_time_str.replace("Z", "+00:00"))
-    dt_est = dt.astimezone(EST)
-    return dt_est.strftime("%I:%M %p EST")
+    return parse_event_time(iso_time_str).strftime(EVENT_TIME_FORMAT)
+
+
+def parse_zoom_start_time(start_time_str):
+    """Parse a Zoom start_time (UTC, with or without a trailing Z) into an EST datetime."""
+    start_time_utc = datetime.fromisoformat(start_time_str.replace("Z", "+00:00"))
+    if start_time_utc.tzinfo is None:
+        start_time_utc = start_time_utc.replace(tzinfo=timezone.utc)
+    return start_time_utc.astimezone(EST)
+
+
+def zoom_meeting_info(meeting, start_time_est):
+    """Build the recording record used for matching from a Zoom meeting payload"""
+    return {
+        "id": meeting.get("uuid", meeting.get("id")),
+        "topic": meeting.get("topic"),
+        "start_time": start_time_est,
+        "start_time_str": start_time_est.strftime(EVENT_TIME_FORMAT),
+        "has_recordings": len(meeting.get("recording_files", [])) > 0,
+        "raw_meeting_data": meeting,  # Store for transcript checking
+    }
 
 
 def get_invitee_info(event_uri):
@@ -672,7 +1046,7 @@ def get_invitee_info(event_uri):
     url = f"https://api.calendly.com/scheduled_events/{event_id}/invitees"
     
     try:
-        response = requests.get(url, headers=CALENDLY_HEADERS)
+        response = rate_limited_request(CALENDLY_RATE_LIMITER, "GET", url)
         response.raise_for_status()
         data = response.json()
         
@@ -691,6 +1065,20 @@ def get_invitee_info(event_uri):
         return []
 
 
+def get_invitees_for_events(events):
+    """Fetch invitees for each event concurrently; returns a list aligned with events"""
+    def fetch(event):
+        if not event.get("start_time"):
+            return []
+        return get_invitee_info(event.get("uri", ""))
+
+    if not events:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(HTTP_MAX_WORKERS, len(events))) as executor:
+        return list(executor.map(fetch, events))
+
+
 def extract_names_from_zoom_topic(topic):
     """Extract participant names from Zoom meeting topic."""
     # Common patterns in Zoom topics:
@@ -759,12 +1147,11 @@ def names_match(calendly_invitee_names, zoom_recording, zoom_attendees=None):
         return False
     
     # Check if transcript has multiple users (speakers)
-    import re
-    speaker_patterns = re.findall(r'^([^:]+):', transcript_content, re.MULTILINE)
+    speaker_patterns = _SPEAKER_RE.findall(transcript_content)
     unique_speakers = set()
     for speaker in speaker_patterns:
         # Clean up speaker name (remove timestamps, etc.)
-        clean_speaker = re.sub(r'\d+', '', speaker).strip()
+        clean_speaker = _DIGITS_RE.sub('', speaker).strip()
         if clean_speaker and len(clean_speaker) > 1:
             unique_speakers.add(clean_speaker.lower())
     
@@ -802,14 +1189,45 @@ def names_match(calendly_invitee_names, zoom_recording, zoom_attendees=None):
     return False
 
 
+def process_calendly_events(events):
+    """
+    Turn raw active/canceled Calendly events into event_info dicts.
+    Each start time is parsed once; invitees are fetched concurrently.
+    Returns (active_events, canceled_events)
+    """
+    active_events = []
+    canceled_events = []
+
+    # Invitee lookups are one Calendly call per event, so fetch them concurrently
+    invitees_by_event = get_invitees_for_events(events)
+
+    for event, invitees in zip(events, invitees_by_event):
+        # Parse start time and convert to EST
+        dt_est = parse_event_time(event["start_time"])
+
+        event_info = {
+            "name": event.get("name", "Unnamed Event"),
+            "start_time": dt_est,
+            "start_time_str": dt_est.strftime(EVENT_TIME_FORMAT),
+            "end_time_str": format_event_time(event.get("end_time")),
+            "status": event["status"],
+            "uri": event.get("uri", ""),
+            "invitee_name": invitees[0]["name"] if invitees else "Unknown",
+            "invitees": invitees,
+        }
+
+        if event["status"] == "active":
+            active_events.append(event_info)
+        else:
+            canceled_events.append(event_info)
+
+    return active_events, canceled_events
+
+
 def get_calendly_events_for_date_range(user_uri, org_uri, start_date, end_date):
     """Get Calendly events for a specific date range."""
     # Convert dates to UTC for API call
-    start_time_est = EST.localize(datetime.combine(start_date, time(0, 0, 0)))
-    end_time_est = EST.localize(datetime.combine(end_date, time(23, 59, 59)))
-
-    start_time_utc = start_time_est.astimezone(pytz.UTC)
-    end_time_utc = end_time_est.astimezone(pytz.UTC)
+    start_time_utc, end_time_utc = est_day_bounds_utc(start_date, end_date)
 
     url = "https://api.calendly.com/scheduled_events"
     params = {
@@ -818,127 +1236,79 @@ def get_calendly_events_for_date_range(user_uri, org_uri, start_date, end_date):
         "sort": "start_time:asc",
         "min_start_time": start_time_utc.isoformat(),
         "max_start_time": end_time_utc.isoformat(),
+        "count": CALENDLY_PAGE_SIZE,
     }
 
     events = []
 
     while url:
-        response = requests.get(url, headers=CALENDLY_HEADERS, params=params)
+        response = rate_limited_request(CALENDLY_RATE_LIMITER, "GET", url, params=params)
         response.raise_for_status()
         data = response.json()
 
-        # Get all events (both active and canceled)
-        all_events = data.get("collection", [])
-        events.extend(all_events)
+        collection = data.get("collection", [])
+        if not collection:
+            break
+
+        # Keep active and canceled events that have a start time
+        events.extend(
+            event
+            for event in collection
+            if event.get("start_time") and event.get("status") in ("active", "canceled")
+        )
 
+        # next_page already carries the query (including count)
         url = data.get("pagination", {}).get("next_page")
         params = {}
 
-    # Process events to extract relevant information
-    active_events = []
-    canceled_events = []
-
-    for event in events:
-        # Parse start time and convert to EST
-        start_time_str = event.get("start_time")
-        if start_time_str:
-            dt = datetime.fromisoformat(start_time_str.replace("Z", "+00:00"))
-            dt_est = dt.astimezone(EST)
-
-            # Get invitee information
-            invitees = get_invitee_info(event.get("uri", ""))
-            invitee_name = invitees[0]["name"] if invitees else "Unknown"
-            
-            event_info = {
-                "name": event.get("name", "Unnamed Event"),
-                "start_time": dt_est,
-                "start_time_str": format_event_time(event.get("start_time")),
-                "end_time_str": format_event_time(event.get("end_time")),
-                "status": event.get("status"),
-                "uri": event.get("uri", ""),
-                "invitee_name": invitee_name,
-                "invitees": invitees,
-            }
-
-            if event.get("status") == "active":
-                active_events.append(event_info)
-            elif event.get("status") == "canceled":
-                canceled_events.append(event_info)
-
-    return active_events, canceled_events
+    return process_calendly_events(events)
 
 
 def get_calendly_events_for_user(user_uri, org_uri):
     """Get yesterday's Calendly events for a specific user."""
     # Get yesterday's date in EST
-    now_est = datetime.now(EST)
-    yesterday_est = (now_est - timedelta(days=1)).date()
-
-    # Convert to UTC for API call
-    start_time_est = EST.localize(datetime.combine(yesterday_est, time(0, 0, 0)))
-    end_time_est = EST.localize(datetime.combine(yesterday_est, time(23, 59, 59)))
-
-    start_time_utc = start_time_est.astimezone(pytz.UTC)
-    end_time_utc = end_time_est.astimezone(pytz.UTC)
-
-    url = "https://api.calendly.com/scheduled_events"
-    params = {
-        "user": user_uri,
-        "organization": org_uri,
-        "sort": "start_time:asc",
-        "min_start_time": start_time_utc.isoformat(),
-        "max_start_time": end_time_utc.isoformat(),
-    }
+    yesterday_est = get_yesterday_est()
+    return get_calendly_events_for_date_range(user_uri, org_uri, yesterday_est, yesterday_est)
 
-    events = []
-
-    while url:
-        response = requests.get(url, headers=CALENDLY_HEADERS, params=params)
-        response.raise_for_status()
-        data = response.json()
 
-        # Get all events (both active and canceled)
-        all_events = data.get("collection", [])
-        events.extend(all_events)
+# --- MATCHING FUNCTIONS ---
+def sort_meetings_by_start(zoom_meetings):
+    """Return (meetings sorted by start time, their start timestamps) for find_best_zoom_match"""
+    zoom_sorted = sorted(zoom_meetings, key=lambda m: m["start_time"])
+    return zoom_sorted, [m["start_time"].timestamp() for m in zoom_sorted]
 
-        url = data.get("pagination", {}).get("next_page")
-        params = {}
 
-    # Process events to extract relevant information
-    active_events = []
-    canceled_events = []
+def find_best_zoom_match(event_start, invitee_name, zoom_sorted, zoom_starts):
+    """
+    Find the Zoom recording closest in time to event_start whose names match the invitee.
+    Candidates are visited outward from the nearest start time, so the first name match
+    is the closest one and names_match (which downloads transcripts) runs as few times as possible.
+    Returns (best_match, time_diff_minutes) or (None, inf).
+    """
+    event_ts = event_start.timestamp()
+    right = bisect.bisect_left(zoom_starts, event_ts)
+    left = right - 1
+
+    while left >= 0 or right < len(zoom_sorted):
+        left_diff = event_ts - zoom_starts[left] if left >= 0 else float('inf')
+        right_diff = zoom_starts[right] - event_ts if right < len(zoom_sorted) else float('inf')
+        if left_diff <= right_diff:
+            candidate, diff = zoom_sorted[left], left_diff
+            left -= 1
+        else:
+            candidate, diff = zoom_sorted[right], right_diff
+            right += 1
 
-    for event in events:
-        # Parse start time and convert to EST
-        start_time_str = event.get("start_time")
-        if start_time_str:
-            dt = datetime.fromisoformat(start_time_str.replace("Z", "+00:00"))
-            dt_est = dt.astimezone(EST)
-
-            # Get invitee information
-            invitees = get_invitee_info(event.get("uri", ""))
-            invitee_name = invitees[0]["name"] if invitees else "Unknown"
-
-            event_info = {
-                "name": event.get("name", "Unnamed Event"),
-                "start_time": dt_est,
-                "start_time_str": format_event_time(event.get("start_time")),
-                "end_time_str": format_event_time(event.get("end_time")),
-                "status": event.get("status"),
-                "uri": event.get("uri", ""),
-                "invitee_name": invitee_name,
-                "invitees": invitees,
-            }
+        time_diff = diff / 60
+        if DEBUG:
+            print(f"        Checking Zoom recording: {candidate['topic']} at {candidate['start_time'].strftime('%I:%M %p EST')} (diff: {time_diff:.1f} min)")
 
-            if event.get("status") == "active":
-                active_events.append(event_info)
-            elif event.get("status") == "canceled":
-                canceled_events.append(event_info)
+        if names_match([invitee_name], candidate):
+            return candidate, time_diff
 
-    return active_events, canceled_events
+    return None, float('inf')
 
 
-# --- MATCHING FUNCTIONS ---
 def match_events_with_meetings_by_date(calendly_events: List[Dict], zoom_meetings: List[Dict], sales_rep_name: str, access_token: str) -> Dict[str, int]:
     """
     Match Calendly events with Zoom RECORDINGS and return conducted counts by date.
@@ -950,6 +1320,8 @@ def match_events_with_meetings_by_date(calendly_events: List[Dict], zoom_meeting
     print(f"    Matching {len(calendly_events)} Calendly events with {len(zoom_meetings)} Zoom recordings...")
     print(f"    Using transcript verification for sales rep: {sales_rep_name}")
 
+    zoom_sorted, zoom_starts = sort_meetings_by_start(zoom_meetings)
+
     for event in calendly_events:
         event_start = event["start_time"]
         event_date_str = event_start.strftime('%Y-%m-%d')
@@ -959,36 +1331,13 @@ def match_events_with_meetings_by_date(calendly_events: List[Dict], zoom_meeting
             conducted_by_date[event_date_str] = 0
 
         print(f"      Processing Calendly event: {event['name']} at {event_start.strftime('%I:%M %p EST')}")
-        print(f"        Event start time: {event_start}")
 
-        # Look for Zoom recording that matches the invitee name
-        best_match = None
-        best_time_diff = float('inf')
-        
-        # Get invitee name for this event
+        # Look for the closest Zoom recording that matches the invitee name
         invitee_name = event.get("invitee_name", "Unknown")
-        print(f"        Invitee name: {invitee_name}")
-        
-        for zoom_meeting in zoom_meetings:
-            zoom_start = zoom_meeting["start_time"]
+        if DEBUG:
+            print(f"        Invitee name: {invitee_name}")
 
-            # Calculate time difference in minutes
-            time_diff = abs((event_start - zoom_start).total_seconds() / 60)
-
-            print(f"        Checking Zoom recording: {zoom_meeting['topic']} at {zoom_start.strftime('%I:%M %p EST')} (diff: {time_diff:.1f} min)")
-            print(f"          Zoom start time: {zoom_start}")
-
-            # Check if names match using transcript extraction
-            has_name_match = names_match([invitee_name], zoom_meeting)
-            print(f"          Name match: {has_name_match}")
-            
-            # Only consider recordings with name matches
-            if has_name_match:
-                # Among name matches, prefer the closest in time
-                if time_diff < best_time_diff:
-                    best_match = zoom_meeting
-                    best_time_diff = time_diff
-                    print(f"        → New best match (diff: {time_diff:.1f} min, name_match: True)")
+        best_match, best_time_diff = find_best_zoom_match(event_start, invitee_name, zoom_sorted, zoom_starts)
         
         # Process the best match if found
         if best_match:
@@ -997,7 +1346,8 @@ def match_events_with_meetings_by_date(calendly_events: List[Dict], zoom_meeting
             # Check transcript to verify the meeting was actually conducted
             meeting_uuid = best_match.get("id")
             if meeting_uuid:
-                print(f"      Checking transcript for meeting {meeting_uuid}...")
+                if DEBUG:
+                    print(f"      Checking transcript for meeting {meeting_uuid}...")
                 transcript = get_zoom_recording_transcript(meeting_uuid, access_token)
                 
                 if transcript:
@@ -1015,7 +1365,7 @@ def match_events_with_meetings_by_date(calendly_events: List[Dict], zoom_meeting
                 print(f"      ❌ No meeting UUID available - assuming appointment NOT conducted")
                 # Do not increment conducted_by_date
         else:
-            print(f"      ❌ No recording found within 30 minutes")
+            print(f"      ❌ No matching recording found")
 
     return conducted_by_date
 
@@ -1034,8 +1384,7 @@ def match_events_with_meetings(
         f"\n  Matching {len(calendly_events)} Calendly events with {len(zoom_meetings)} Zoom recordings..."
     )
 
-    # Create a copy of zoom meetings to track which ones are matched
-    unmatched_zoom = zoom_meetings.copy()
+    zoom_sorted, zoom_starts = sort_meetings_by_start(zoom_meetings)
 
     for event in calendly_events:
         event_start = event["start_time"]
@@ -1044,38 +1393,13 @@ def match_events_with_meetings(
         print(
             f"    Calendly event: {event['name']} at {event_start.strftime('%I:%M %p EST')}"
         )
-        print(f"      Event start time: {event_start}")
 
-        # Look for Zoom recording that matches the invitee name
-        best_match = None
-        best_time_diff = float('inf')
-        
-        # Get invitee name for this event
+        # Look for the closest Zoom recording that matches the invitee name
         invitee_name = event.get("invitee_name", "Unknown")
-        print(f"    Invitee name: {invitee_name}")
-        
-        for zoom_meeting in zoom_meetings:
-            zoom_start = zoom_meeting["start_time"]
-
-            # Calculate time difference in minutes
-            time_diff = abs((event_start - zoom_start).total_seconds() / 60)
-
-            print(
-                f"      Checking Zoom recording: {zoom_meeting['topic']} at {zoom_start.strftime('%I:%M %p EST')} (diff: {time_diff:.1f} min)"
-            )
-            print(f"        Zoom start time: {zoom_start}")
+        if DEBUG:
+            print(f"    Invitee name: {invitee_name}")
 
-            # Check if names match using transcript extraction
-            has_name_match = names_match([invitee_name], zoom_meeting)
-            print(f"        Name match: {has_name_match}")
-            
-            # Only consider recordings with name matches
-            if has_name_match:
-                # Among name matches, prefer the closest in time
-                if time_diff < best_time_diff:
-                    best_match = zoom_meeting
-                    best_time_diff = time_diff
-                    print(f"        → New best match (diff: {time_diff:.1f} min, name_match: True)")
+        best_match, best_time_diff = find_best_zoom_match(event_start, invitee_name, zoom_sorted, zoom_starts)
         
         # Process the best match if found
         if best_match:
@@ -1086,7 +1410,8 @@ def match_events_with_meetings(
             if sales_rep_name and access_token:
                 meeting_uuid = best_match.get("id")
                 if meeting_uuid:
-                    print(f"        Checking transcript for meeting {meeting_uuid}...")
+                    if DEBUG:
+                        print(f"        Checking transcript for meeting {meeting_uuid}...")
                     transcript = get_zoom_recording_transcript(meeting_uuid, access_token)
                     
                     if transcript:
@@ -1110,10 +1435,6 @@ def match_events_with_meetings(
                 matched_events.append(matched_event)
                 matched = True
 
-                # Remove from unmatched zoom meetings only if transcript verified
-                if best_match in unmatched_zoom:
-                    unmatched_zoom.remove(best_match)
-                
                 print(f"        ✅ MATCHED! Time difference: {best_time_diff:.1f} minutes")
             else:
                 print(f"        ❌ Not counted as conducted due to transcript verification")
@@ -1130,49 +1451,53 @@ def match_events_with_meetings(
 
 
 # --- GOOGLE SHEETS FUNCTIONS ---
-def parse_date_from_sheet_name(sheet_name):
-    """Parse date from sheet name like 'June 27 - July 13' and return the end date"""
+# Full and abbreviated month names ("july", "jul") -> month number
+_MONTH_NUMBERS = {
+    name.lower(): number
+    for names in (calendar.month_name, calendar.month_abbr)
+    for number, name in enumerate(names)
+    if name
+}
+# Exact full month names only ("July") -> month number, for master-sheet tabs
+_FULL_MONTH_NUMBERS = {name: number for number, name in enumerate(calendar.month_name) if name}
+
+
+def sheet_name_date(month, day, year):
+    """Build the date for a sheet-name month/day pair like ('July', '13')"""
+    month_number = _MONTH_NUMBERS.get(month.lower())
+    if month_number is None:
+        raise ValueError(f"unknown month name '{month}'")
+    return datetime(year, month_number, int(day))
+
+
+def parse_date_from_sheet_name(sheet_name, current_year=None):
+    """
+    Parse date from sheet name like 'June 27 - July 13' and return the end date.
+    Sheets are assumed to be from `current_year` (defaults to this year).
+    """
+    if current_year is None:
+        current_year = datetime.now().year
+    return _parse_date_from_sheet_name(sheet_name, current_year)
+
+
+@lru_cache(maxsize=256)
+def _parse_date_from_sheet_name(sheet_name, current_year):
     try:
-        # Pattern to match "Month Day - Month Day" format
-        pattern = r"([A-Za-z]+)\s+(\d+)\s*-\s*([A-Za-z]+)\s+(\d+)"
-        match = re.match(pattern, sheet_name.strip())
+        # Match "Month Day - Month Day" format
+        match = _DATE_RANGE_RE.match(sheet_name.strip())
 
         if match:
             start_month, start_day, end_month, end_day = match.groups()
 
-            # Get current year (assuming sheets are from current year)
-            current_year = datetime.now().year
-
             # Parse the end date (assuming it's the more recent date)
-            try:
-                end_date = datetime.strptime(
-                    f"{end_month} {end_day} {current_year}", "%B %d %Y"
-                )
-                return end_date
-            except ValueError:
-                # Try with abbreviated month names
-                end_date = datetime.strptime(
-                    f"{end_month} {end_day} {current_year}", "%b %d %Y"
-                )
-                return end_date
+            return sheet_name_date(end_month, end_day, current_year)
 
         # If no match, try other common date formats
         # Try "Month Day" format
-        pattern2 = r"([A-Za-z]+)\s+(\d+)"
-        match2 = re.search(pattern2, sheet_name.strip())
+        match2 = _DATE_SINGLE_RE.search(sheet_name.strip())
         if match2:
             month, day = match2.groups()
-            current_year = datetime.now().year
-            try:
-                date = datetime.strptime(
-                    f"{month} {day} {current_year}", "%B %d %Y"
-                )
-                return date
-            except ValueError:
-                date = datetime.strptime(
-                    f"{month} {day} {current_year}", "%b %d %Y"
-                )
-                return date
+            return sheet_name_date(month, day, current_year)
 
     except Exception as e:
         print(f"Could not parse date from sheet name '{sheet_name}': {e}")
@@ -1185,10 +1510,12 @@ def get_latest_sheet(sheets_info):
     """Get the latest sheet based on date parsing from sheet names"""
     sheet_dates = []
 
+    current_year = datetime.now().year
+
     print("Available sheets:")
     for sheet_info in sheets_info:
         sheet_name = sheet_info["properties"]["title"]
-        parsed_date = parse_date_from_sheet_name(sheet_name)
+        parsed_date = parse_date_from_sheet_name(sheet_name, current_year)
         sheet_dates.append((sheet_name, parsed_date, sheet_info))
 
         if parsed_date:
@@ -1219,20 +1546,129 @@ def get_latest_sheet(sheets_info):
     return latest_sheet_info
 
 
+def get_sheet_covering_date(sheets_info, target_date):
+    """
+    Get the sheet whose period covers target_date: the one with the earliest
+    parsed end date on or after it (sheet names are read in target_date's year).
+    Dates past every sheet's end fall back to the latest sheet.
+    """
+    covering = []
+    for sheet_info in sheets_info:
+        end_date = parse_date_from_sheet_name(sheet_info["properties"]["title"], target_date.year)
+        if end_date is not None and end_date.date() >= target_date:
+            covering.append((end_date, sheet_info))
+
+    if not covering:
+        print(f"No sheet's period covers {target_date}; using the latest sheet.")
+        return get_latest_sheet(sheets_info)
+
+    end_date, sheet_info = min(covering, key=itemgetter(0))
+    print(
+        f"\nSelected sheet covering {target_date}: '{sheet_info['properties']['title']}' "
+        f"(ends: {end_date.strftime('%Y-%m-%d')})"
+    )
+    return sheet_info
+
+
+# Sales spreadsheet tab list, plus the values of each tab read since, shared
+# until SALES_SHEET_CACHE_TTL expires
+_sales_sheets_cache = {"fetched_at": None, "sheets": None, "values": {}}
+_sales_sheets_lock = threading.Lock()
+
+
+def _fetch_sales_sheet(select_sheet):
+    """
+    Return (title, values) of the sales sheet picked by select_sheet(sheets).
+    The tab list and each tab's values are reused for SALES_SHEET_CACHE_TTL
+    seconds, so the daily and per-date analyses (and every date of a backfill)
+    share their Sheets round trips. Returns (None, []) when no sheet is picked.
+    """
+    with _sales_sheets_lock:
+        fetched_at = _sales_sheets_cache["fetched_at"]
+        if fetched_at is None or monotonic() - fetched_at >= SALES_SHEET_CACHE_TTL:
+            # Get all sheets information
+            spreadsheet_metadata = (
+                service.spreadsheets()
+                .get(spreadsheetId=SPREADSHEET_ID, fields="sheets.properties")
+                .execute()
+            )
+            _sales_sheets_cache.update(
+                fetched_at=monotonic(),
+                sheets=spreadsheet_metadata.get("sheets", []),
+                values={},
+            )
+        sheets = _sales_sheets_cache["sheets"]
+
+        if not sheets:
+            print("No sheets found in this spreadsheet.")
+            return None, []
+
+        sheet_info = select_sheet(sheets)
+        if not sheet_info:
+            print("Could not determine which sheet to read.")
+            return None, []
+
+        sheet_title = sheet_info["properties"]["title"]
+        values_by_title = _sales_sheets_cache["values"]
+        if sheet_title not in values_by_title:
+            # Fetch data from the selected sheet
+            result = (
+                sheet.values()
+                .get(spreadsheetId=SPREADSHEET_ID, range=f"'{sheet_title}'!A1:Z")
+                .execute()
+            )
+            values_by_title[sheet_title] = result.get("values", [])
+
+        return sheet_title, values_by_title[sheet_title]
+
+
+def fetch_latest_sales_sheet():
+    """Return (title, values) of the latest sheet in the sales spreadsheet"""
+    return _fetch_sales_sheet(get_latest_sheet)
+
+
+def fetch_sales_sheet_for_date(target_date):
+    """Return (title, values) of the sales sheet whose period covers target_date"""
+    return _fetch_sales_sheet(lambda sheets: get_sheet_covering_date(sheets, target_date))
+
+
 def get_all_unique_users(df, demo_by_col):
     """Get all unique users from Demo By column, excluding JASON"""
-    all_users = df[demo_by_col].dropna().unique()
+    all_users = pd.Series(df[demo_by_col].dropna().unique())
     # Filter out JASON (case-insensitive) and empty strings
-    filtered_users = [
-        user
-        for user in all_users
-        if user.strip() and user.upper().strip() != "JASON"
-    ]
+    stripped = all_users.str.strip()
+    filtered_users = all_users[(stripped != "") & (stripped.str.upper() != "JASON")]
     return sorted(filtered_users)
 
 
-def get_master_sheet_data():
-    """Get data from the master sheet for running close rate calculation"""
+def fetch_master_ranges(ranges):
+    """
+    Read several ranges of the master sheet in one batchGet round-trip.
+    Numbers come back unformatted (as floats), so the parse_* helpers skip string cleanup.
+    Returns {range: values} keyed by the requested range strings.
+    """
+    result = (
+        sheet.values()
+        .batchGet(
+            spreadsheetId=MASTER_SHEET_ID,
+            ranges=ranges,
+            valueRenderOption="UNFORMATTED_VALUE",
+            fields="valueRanges(values)",
+        )
+        .execute(num_retries=SHEETS_NUM_RETRIES)
+    )
+    return {
+        requested: value_range.get("values", [])
+        for requested, value_range in zip(ranges, result.get("valueRanges", []))
+    }
+
+
+def get_master_sheet_data(values=None):
+    """
+    Get data from the master sheet for running close rate calculation.
+    Pass already-fetched rows starting at column A (e.g. "A:D" or "A:K") to
+    skip the sheet read; only columns A-D are used.
+    """
     if not MASTER_SHEET_ID:
         print(
             "Warning: MASTER_SHEET_ID not found. Skipping running close rate calculation."
@@ -1240,16 +1676,11 @@ def get_master_sheet_data():
         return {}
 
     try:
-        print(f"\nFetching data from master sheet: {MASTER_SHEET_ID}")
+        if values is None:
+            print(f"\nFetching data from master sheet: {MASTER_SHEET_ID}")
 
-        # Fetch data from the master sheet (columns A, C, D)
-        master_sheet_range = "A:D"  # Get columns A through D
-        result = (
-            sheet.values()
-            .get(spreadsheetId=MASTER_SHEET_ID, range=master_sheet_range)
-            .execute()
-        )
-        values = result.get("values", [])
+            # Fetch data from the master sheet (columns A, C, D)
+            values = fetch_master_ranges(["A:D"])["A:D"]
 
         if not values:
             print("No data found in master sheet.")
@@ -1260,33 +1691,31 @@ def get_master_sheet_data():
         # Create a mapping of sales rep names to their data
         master_data = {}
 
-        # Process each row (skip header if exists)
-        for i, row in enumerate(values):
-            if len(row) >= 4:  # Ensure we have at least 4 columns
-                name = row[0].strip() if row[0] else ""  # Column A - name
-                col_c_value = (
-                    parse_numeric_value(row[2]) if len(row) > 2 else 0.0
-                )  # Column C
-                col_d_value = (
-                    parse_numeric_value(row[3]) if len(row) > 3 else 0.0
-                )  # Column D
-
-                if (
-                    name and name.upper() != "JASON"
-                ):  # Exclude JASON and empty names
-                    # Normalize name to match with our user mappings
-                    normalized_name = name.lower().strip()
-
-                    master_data[normalized_name] = {
-                        "original_name": name,
-                        "col_c": col_c_value,
-                        "col_d": col_d_value,
-                        "row_index": i + 1,  # 1-based row index
-                    }
+        # Parse columns A, C and D in one pass each; short rows are padded with None
+        frame = pd.DataFrame(values).reindex(columns=range(4))
+        names = frame[0].fillna("").astype(str).str.strip()  # Column A - name
+        col_c_values = parse_numeric_series(frame[2]).tolist()  # Column C
+        col_d_values = parse_numeric_series(frame[3]).tolist()  # Column D
+
+        # Only rows that reach column D, excluding JASON and empty names. Wider
+        # reads return an empty D as "" when later columns have data.
+        has_col_d = frame[3].notna() & (frame[3] != "")
+        keep = has_col_d & (names != "") & (names.str.upper() != "JASON")
+
+        for i in frame.index[keep]:
+            name = names[i]
+
+            # Normalize name to match with our user mappings
+            master_data[name.lower()] = {
+                "original_name": name,
+                "col_c": col_c_values[i],
+                "col_d": col_d_values[i],
+                "row_index": i + 1,  # 1-based row index
+            }
 
-                    print(
-                        f"  {name}: Column C = {col_c_value}, Column D = {col_d_value}"
-                    )
+            print(
+                f"  {name}: Column C = {col_c_values[i]}, Column D = {col_d_values[i]}"
+            )
 
         # Get the special value from row 5, column D
         row_5_col_d = 0.0
@@ -1305,45 +1734,52 @@ def get_master_sheet_data():
         return {}
 
 
-def calculate_running_close_rate():
+CLOSE_RATE_REP_ALIASES = {
+    "sierra": ["sierra", "sierrac"],
+    "mikaela": ["mikaela"],
+    "mike": ["mike", "hammer"],
+}
+
+
+def calculate_running_close_rate(master_data=None, today_sits=None, today_closes=None):
     """
     Re-compute each rep's Running Close Rate (Sit→Sale) without ever
     exceeding 100 %.
-    - Relies on globals created elsewhere in the script:
-        • user_appointments_conducted  – today's *conducted* sits per rep
-        • new_clients_counts           – today's *non-organic* closes per rep
+    - today_sits:   today's *conducted* sits per rep (defaults to the
+                    run_state's user_appointments_conducted)
+    - today_closes: today's *non-organic* closes per rep (defaults to
+                    run_state's new_clients_counts)
+    - master_data: result of get_master_sheet_data(), fetched if not given
     """
-    master_data = get_master_sheet_data()
+    if master_data is None:
+        master_data = get_master_sheet_data()
     if not master_data:
         print("Skipping close-rate calc – no master data.")
         return {}
 
-    # pull the two today-dicts from global scope
-    today_sits = globals().get("user_appointments_conducted", {})
-    today_closes = globals().get("new_clients_counts", {})
+    if today_sits is None:
+        today_sits = run_state["user_appointments_conducted"]
+    if today_closes is None:
+        today_closes = run_state["new_clients_counts"]
 
-    name_map = {
-        "sierra": ["sierra", "sierrac"],
-        "mikaela": ["mikaela"],
-        "mike": ["mike", "hammer"],
-    }
+    # alias -> first master row (columns C & D) whose name contains it, in one pass
+    rows_by_alias = {}
+    for k, d in master_data.items():
+        if k == "_row_5_col_d":
+            continue
+        for aliases in CLOSE_RATE_REP_ALIASES.values():
+            for alias in aliases:
+                if alias in k:
+                    rows_by_alias.setdefault(alias, d)
 
     close_rates = {}
 
-    for rep_key, aliases in name_map.items():
-        # locate this rep's row in master_data (columns C & D)
-        rep_row = None
-        for alias in aliases:
-            rep_row = next(
-                (
-                    d
-                    for k, d in master_data.items()
-                    if k != "_row_5_col_d" and alias in k
-                ),
-                None,
-            )
-            if rep_row:
-                break
+    for rep_key, aliases in CLOSE_RATE_REP_ALIASES.items():
+        # locate this rep's row: the first alias with a matching row wins
+        rep_row = next(
+            (rows_by_alias[alias] for alias in aliases if alias in rows_by_alias),
+            None,
+        )
 
         if not rep_row:
             close_rates[rep_key] = 0.0
@@ -1366,47 +1802,91 @@ def calculate_running_close_rate():
     return close_rates
 
 
+def by_value_then_name(item):
+    """Sort key for (name, value) pairs: highest value first, then by name"""
+    return (-item[1], item[0])
+
+
 def create_slack_message(
     demo_by_data, all_users, sheet_name, metric_title, is_revenue=False
 ):
     """Create Slack message for a metric"""
-    if is_revenue:
-        complete_data = {
-            user: demo_by_data.get(user, 0.0) for user in all_users
-        }
-    else:
-        complete_data = {user: demo_by_data.get(user, 0) for user in all_users}
+    default = 0.0 if is_revenue else 0
+    complete_data = {user: demo_by_data.get(user, default) for user in all_users}
 
     if not complete_data:
         return f"✅ *{metric_title}*\nPeriod: {sheet_name}\n\nNo data found for this metric."
 
     # Sort by value (highest first), then by name
-    sorted_data = sorted(complete_data.items(), key=lambda x: (-x[1], x[0]))
+    sorted_data = sorted(complete_data.items(), key=by_value_then_name)
 
     total_value = sum(complete_data.values())
 
-    message = f"""✅ *{metric_title}*
+    parts = [f"""✅ *{metric_title}*
 Period: {sheet_name}
 
 *TEAM PERFORMANCE:*
-"""
+"""]
 
     for name, value in sorted_data:
         display_name = name.strip() if name.strip() else "(Not Specified)"
         if is_revenue:
-            message += f"• {display_name}: ${value:,.0f}\n"
+            parts.append(f"• {display_name}: ${value:,.0f}\n")
         else:
-            message += f"• {display_name}: {value}\n"
+            parts.append(f"• {display_name}: {value}\n")
 
     if is_revenue:
-        message += f"\n*TOTAL: ${total_value:,.0f}*"
+        parts.append(f"\n*TOTAL: ${total_value:,.0f}*")
     else:
-        message += f"\n*TOTAL: {total_value}*"
+        parts.append(f"\n*TOTAL: {total_value}*")
 
-    return message
+    return "".join(parts)
 
 
 # --- MASTER SHEET ADDITIONAL METRICS ---
+@lru_cache(maxsize=256)
+def master_rep_name(sales_rep):
+    """Map a lower-cased master-sheet rep label to its canonical rep, or None"""
+    if "mikaela" in sales_rep:
+        return "mikaela"
+    if "mike" in sales_rep or "hammer" in sales_rep:
+        return "mike"
+    if "sierra" in sales_rep:
+        return "sierra"
+    return None
+
+
+_master_sheets_cache = {"fetched_at": None, "sheets": None}
+_master_sheets_lock = threading.Lock()
+
+
+def get_master_sheets():
+    """
+    Return the master spreadsheet's sheets (sheets.properties), reusing one
+    read for MASTER_SHEET_CACHE_TTL seconds. Sheet values are never cached,
+    since the run itself writes to them.
+    """
+    with _master_sheets_lock:
+        fetched_at = _master_sheets_cache["fetched_at"]
+        if fetched_at is not None and monotonic() - fetched_at < MASTER_SHEET_CACHE_TTL:
+            return _master_sheets_cache["sheets"]
+
+        spreadsheet_metadata = (
+            service.spreadsheets()
+            .get(spreadsheetId=MASTER_SHEET_ID, fields="sheets.properties")
+            .execute(num_retries=SHEETS_NUM_RETRIES)
+        )
+        sheets = spreadsheet_metadata.get("sheets", [])
+        _master_sheets_cache.update(fetched_at=monotonic(), sheets=sheets)
+        return sheets
+
+
+def invalidate_master_sheets():
+    """Forget the cached master sheet list (call after adding sheets)"""
+    with _master_sheets_lock:
+        _master_sheets_cache.update(fetched_at=None, sheets=None)
+
+
 def get_yesterday_sheet_name():
     """Get the sheet name for yesterday's date"""
     yesterday = (datetime.now(EST) - timedelta(days=1)).date()
@@ -1416,12 +1896,7 @@ def find_yesterday_sheet_in_master():
     """Find yesterday's sheet in the master spreadsheet"""
     try:
         # Get all sheets information from master spreadsheet
-        spreadsheet_metadata = (
-            service.spreadsheets()
-            .get(spreadsheetId=MASTER_SHEET_ID, fields="sheets.properties")
-            .execute()
-        )
-        sheets = spreadsheet_metadata.get("sheets", [])
+        sheets = get_master_sheets()
         
         yesterday_sheet_name = get_yesterday_sheet_name()
         print(f"Looking for sheet: '{yesterday_sheet_name}'")
@@ -1433,15 +1908,14 @@ def find_yesterday_sheet_in_master():
                 print(f"✅ Found exact match: '{sheet_name}'")
                 return sheet_name
         
-        # Look for partial match (in case of different formatting)
+        # Look for partial match (in case of different formatting):
+        # a sheet whose words include both the month and the day
         yesterday_parts = yesterday_sheet_name.lower().split()
-        for sheet_info in sheets:
-            sheet_name = sheet_info["properties"]["title"]
-            sheet_parts = sheet_name.lower().split()
-            
-            # Check if month and day match
-            if len(yesterday_parts) >= 2 and len(sheet_parts) >= 2:
-                if yesterday_parts[0] in sheet_parts and yesterday_parts[1] in sheet_parts:
+        if len(yesterday_parts) >= 2:
+            month_and_day = set(yesterday_parts[:2])
+            for sheet_info in sheets:
+                sheet_name = sheet_info["properties"]["title"]
+                if month_and_day.issubset(sheet_name.lower().split()):
                     print(f"✅ Found partial match: '{sheet_name}'")
                     return sheet_name
         
@@ -1456,49 +1930,79 @@ def find_yesterday_sheet_in_master():
         print(f"Error finding yesterday's sheet: {e}")
         return None
 
-def get_master_sheet_additional_metrics():
-    """Get additional metrics from yesterday's sheet in the master spreadsheet"""
-    sheet_name = find_yesterday_sheet_in_master()
-    if not sheet_name:
-        print("Cannot get additional metrics without finding yesterday's sheet")
-        return False
-    
+def fetch_yesterday_master_values(cell_range):
+    """
+    Read `cell_range` (e.g. "A1:M10") from yesterday's sheet in the master spreadsheet.
+    The sheet is normally titled exactly get_yesterday_sheet_name(), so that title is
+    read directly; the sheet list is only searched when no such sheet exists.
+    Returns (sheet_name, values), or (None, []) when yesterday's sheet can't be found.
+    """
+    sheet_name = get_yesterday_sheet_name()
     try:
-        print(f"\n📊 Fetching additional metrics from master sheet: '{sheet_name}'")
-        
-        # Fetch data from the sheet
-        sheet_range = f"'{sheet_name}'!A1:M10"  # Get enough rows and columns
         result = (
             sheet.values()
-            .get(spreadsheetId=MASTER_SHEET_ID, range=sheet_range)
+            .get(spreadsheetId=MASTER_SHEET_ID, range=f"'{sheet_name}'!{cell_range}")
             .execute()
         )
-        values = result.get("values", [])
+        print(f"✅ Found exact match: '{sheet_name}'")
+        return sheet_name, result.get("values", [])
+    except HttpError as err:
+        # 400 "Unable to parse range" means there is no sheet with that title
+        if err.resp.status != 400:
+            raise
+
+    sheet_name = find_yesterday_sheet_in_master()
+    if not sheet_name:
+        return None, []
+
+    result = (
+        sheet.values()
+        .get(spreadsheetId=MASTER_SHEET_ID, range=f"'{sheet_name}'!{cell_range}")
+        .execute()
+    )
+    return sheet_name, result.get("values", [])
+
+
+# Parser for each of the master sheet's metric columns B..M, in order
+MASTER_METRIC_COLUMN_PARSERS = (
+    [parse_numeric_series] * 6        # B-G: booked, conducted, new, organic, total new, rebuy
+    + [parse_percentage_series] * 2   # H-I: show rate, running close rate
+    + [parse_currency_series] * 4     # J-M: new client, rebuy, total revenue, avg deal size
+)
+
+
+def get_master_sheet_additional_metrics():
+    """Get additional metrics from yesterday's sheet in the master spreadsheet"""
+    try:
+        # Get enough rows and columns
+        sheet_name, values = fetch_yesterday_master_values("A1:M10")
+        if not sheet_name:
+            print("Cannot get additional metrics without finding yesterday's sheet")
+            return False
+
+        print(f"\n📊 Fetched additional metrics from master sheet: '{sheet_name}'")
         
         if not values:
             print("No data found in the sheet")
             return False
         
+        # Parse the metric columns B..M whole; short rows are padded with None
+        frame = pd.DataFrame(values[1:]).reindex(columns=range(len(MASTER_METRIC_COLUMN_PARSERS) + 1))
+        parsed_rows = zip(*(
+            parser(frame[col]).astype(float).tolist()
+            for col, parser in enumerate(MASTER_METRIC_COLUMN_PARSERS, start=1)
+        ))
+
         # Process each representative row (skip header)
-        for row_idx in range(1, len(values)):
-            if row_idx >= len(values) or len(values[row_idx]) == 0:
-                continue
-                
-            row = values[row_idx]
+        for row, parsed in zip(values[1:], parsed_rows):
             if len(row) < 2:  # Need at least sales rep name
                 continue
                 
             sales_rep = row[0].strip().lower() if row[0] else ""
             
             # Map sales rep names to our canonical names
-            rep_name = None
-            if "mikaela" in sales_rep:
-                rep_name = "mikaela"
-            elif "mike" in sales_rep or "hammer" in sales_rep:
-                rep_name = "mike"
-            elif "sierra" in sales_rep:
-                rep_name = "sierra"
-            elif "team total" in sales_rep.lower():
+            rep_name = master_rep_name(sales_rep)
+            if not rep_name and "team total" in sales_rep:
                 continue  # Skip team total row
             
             if not rep_name:
@@ -1507,37 +2011,41 @@ def get_master_sheet_additional_metrics():
             
             print(f"\nProcessing additional metrics for {rep_name} ({sales_rep}):")
             
-            # Extract additional metrics from master sheet (with safe indexing)
-            master_appointments_booked = parse_numeric_value(row[1] if len(row) > 1 else 0)
-            master_appointments_conducted = parse_numeric_value(row[2] if len(row) > 2 else 0)
-            master_new_clients_closed = parse_numeric_value(row[3] if len(row) > 3 else 0)
-            master_organic_clients_closed = parse_numeric_value(row[4] if len(row) > 4 else 0)
-            master_total_new_clients = parse_numeric_value(row[5] if len(row) > 5 else 0)
-            master_rebuy_clients = parse_numeric_value(row[6] if len(row) > 6 else 0)
-            master_show_rate = parse_percentage_value(row[7] if len(row) > 7 else 0)
-            master_running_close_rate = parse_percentage_value(row[8] if len(row) > 8 else 0)
-            master_new_client_revenue = parse_currency_value(row[9] if len(row) > 9 else 0)
-            master_rebuy_revenue = parse_currency_value(row[10] if len(row) > 10 else 0)
-            master_total_revenue = parse_currency_value(row[11] if len(row) > 11 else 0)
-            master_avg_deal_size = parse_currency_value(row[12] if len(row) > 12 else 0)
+            # Additional metrics from master sheet (missing cells parse as 0)
+            (
+                master_appointments_booked,
+                master_appointments_conducted,
+                master_new_clients_closed,
+                master_organic_clients_closed,
+                master_total_new_clients,
+                master_rebuy_clients,
+                master_show_rate,
+                master_running_close_rate,
+                master_new_client_revenue,
+                master_rebuy_revenue,
+                master_total_revenue,
+                master_avg_deal_size,
+            ) = parsed
             
             # Calculate appointments canceled (booked - conducted, but ensure non-negative)
             master_appointments_canceled = max(0, master_appointments_booked - master_appointments_conducted)
             
             # Store additional metrics with "master_" prefix to distinguish from calculated ones
-            store_metric(rep_name, "master_appointments_booked", master_appointments_booked, "count", "Master Sheet")
-            store_metric(rep_name, "master_appointments_conducted", master_appointments_conducted, "count", "Master Sheet")
-            store_metric(rep_name, "master_appointments_canceled", master_appointments_canceled, "count", "Master Sheet")
-            store_metric(rep_name, "master_show_rate", master_show_rate, "percentage", "Master Sheet")
-            store_metric(rep_name, "master_new_clients_closed", master_new_clients_closed, "count", "Master Sheet")
-            store_metric(rep_name, "master_organic_clients_closed", master_organic_clients_closed, "count", "Master Sheet")
-            store_metric(rep_name, "master_total_new_clients_closed", master_total_new_clients, "count", "Master Sheet")
-            store_metric(rep_name, "master_rebuy_clients", master_rebuy_clients, "count", "Master Sheet")
-            store_metric(rep_name, "master_running_close_rate", master_running_close_rate, "percentage", "Master Sheet")
-            store_metric(rep_name, "master_new_client_revenue", master_new_client_revenue, "currency", "Master Sheet")
-            store_metric(rep_name, "master_rebuy_revenue", master_rebuy_revenue, "currency", "Master Sheet")
-            store_metric(rep_name, "master_total_revenue", master_total_revenue, "currency", "Master Sheet")
-            store_metric(rep_name, "master_average_deal_size", master_avg_deal_size, "currency", "Master Sheet")
+            store_metrics_bulk(rep_name, {
+                "master_appointments_booked": (master_appointments_booked, "count"),
+                "master_appointments_conducted": (master_appointments_conducted, "count"),
+                "master_appointments_canceled": (master_appointments_canceled, "count"),
+                "master_show_rate": (master_show_rate, "percentage"),
+                "master_new_clients_closed": (master_new_clients_closed, "count"),
+                "master_organic_clients_closed": (master_organic_clients_closed, "count"),
+                "master_total_new_clients_closed": (master_total_new_clients, "count"),
+                "master_rebuy_clients": (master_rebuy_clients, "count"),
+                "master_running_close_rate": (master_running_close_rate, "percentage"),
+                "master_new_client_revenue": (master_new_client_revenue, "currency"),
+                "master_rebuy_revenue": (master_rebuy_revenue, "currency"),
+                "master_total_revenue": (master_total_revenue, "currency"),
+                "master_average_deal_size": (master_avg_deal_size, "currency"),
+            }, "Master Sheet")
             
             print(f"  Master Appointments Booked: {master_appointments_booked}")
             print(f"  Master Appointments Conducted: {master_appointments_conducted}")
@@ -1549,20 +2057,22 @@ def get_master_sheet_additional_metrics():
         
     except Exception as e:
         print(f"Error fetching master sheet additional metrics: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
 
 # --- MESSAGE CREATION FUNCTIONS ---
-def create_running_close_rate_message(close_rates):
+def create_running_close_rate_message(close_rates, yesterday=None):
     """Create Slack message for Running Close Rate metric"""
-    message = f"""✅ *RUNNING CLOSE RATE (CALCULATED)*
-Date: {(datetime.now(EST) - timedelta(days=1)).strftime('%Y-%m-%d')} (Yesterday)
+    if yesterday is None:
+        yesterday = get_yesterday_est()
+
+    parts = [f"""✅ *RUNNING CLOSE RATE (CALCULATED)*
+Date: {yesterday.strftime('%Y-%m-%d')} (Yesterday)
 Source: Master Sheet + Appointments Data
 
 *TEAM PERFORMANCE:*
-"""
+"""]
 
     # Sort by close rate (highest first)
     sorted_rates = sorted(
@@ -1570,199 +2080,164 @@ Source: Master Sheet + Appointments Data
     )
 
     for name, rate in sorted_rates:
-        display_name = name.title()
-        message += f"• {display_name}: {rate:.1f}%\n"
+        parts.append(f"• {name.title()}: {rate:.1f}%\n")
 
     # Calculate average close rate
     if close_rates:
         avg_rate = sum(close_rates.values()) / len(close_rates)
-        message += f"\n*AVERAGE CLOSE RATE: {avg_rate:.1f}%*"
-
-    return message
+        parts.append(f"\n*AVERAGE CLOSE RATE: {avg_rate:.1f}%*")
 
+    return "".join(parts)
 
-def create_appointments_booked_message(user_results):
-    """Create Slack message for Total Appointments Booked metric (including canceled)"""
-    total_booked = sum(
-        result["scheduled_count"] for result in user_results.values()
-    )
 
-    total_canceled = sum(
-        result["canceled_count"] for result in user_results.values()
-    )
-
-    # Sort by booked count (highest first)
-    sorted_users = sorted(
-        user_results.items(),
-        key=lambda x: x[1]["scheduled_count"],
-        reverse=True,
-    )
-
-    message = f"""✅ *TOTAL APPOINTMENTS BOOKED (CALCULATED)*
-Date: {(datetime.now(EST) - timedelta(days=1)).strftime('%Y-%m-%d')} (Yesterday)
-Source: Calendly API
+def create_appointment_messages(user_results, yesterday=None):
+    """
+    Create the Slack messages for Appointments Booked (including canceled),
+    Appointments Conducted and Show Rate in a single pass over user_results.
+    Returns {"booked": str, "conducted": str, "show_rate": str}
+    """
+    if yesterday is None:
+        yesterday = get_yesterday_est()
+    yesterday_str = yesterday.strftime('%Y-%m-%d')
 
-*TEAM PERFORMANCE:*
-"""
+    # One row per rep: (name, booked, canceled, conducted, show_rate)
+    rows = []
+    total_booked = total_canceled = total_conducted = 0
 
-    for name, result in sorted_users:
-        count = result["scheduled_count"]
+    for name, result in user_results.items():
+        booked = result["scheduled_count"]
         canceled = result["canceled_count"]
-        display_name = name.title()
-        message += f"• {display_name}: {count} appointments\n"
-        if canceled > 0:
-            message += f"  ↳ Canceled: {canceled}\n"
-
-        # Store calculated metrics
-        store_metric(name, "calculated_appointments_booked", count, "count", "Calendly")
-        store_metric(name, "calculated_appointments_canceled", canceled, "count", "Calendly")
-
-    message += f"\n*TOTAL BOOKED: {total_booked}*"
-    if total_canceled > 0:
-        message += f"\n*TOTAL CANCELED: {total_canceled}*"
-
-    return message
-
-
-def create_appointments_conducted_message(user_results):
-    """Create Slack message for Total Appointments Conducted metric"""
-    total_conducted = sum(
-        result["conducted_count"] for result in user_results.values()
-    )
-
-    # Sort by conducted count (highest first)
-    sorted_users = sorted(
-        user_results.items(),
-        key=lambda x: x[1]["conducted_count"],
-        reverse=True,
-    )
-
-    message = f"""✅ *TOTAL APPOINTMENTS CONDUCTED (CALCULATED)*
-Date: {(datetime.now(EST) - timedelta(days=1)).strftime('%Y-%m-%d')} (Yesterday)
-Source: Calendly + Zoom Recordings
-
-*TEAM PERFORMANCE:*
-"""
+        conducted = result["conducted_count"]
+        show_rate = (conducted / booked * 100) if booked > 0 else 0
 
-    for name, result in sorted_users:
-        count = result["conducted_count"]
-        display_name = name.title()
-        message += f"• {display_name}: {count} appointments\n"
+        rows.append((name, booked, canceled, conducted, show_rate))
+        total_booked += booked
+        total_canceled += canceled
+        total_conducted += conducted
 
         # Store calculated metrics
-        store_metric(name, "calculated_appointments_conducted", count, "count", "Calendly + Zoom")
-
-    message += f"\n*TOTAL CONDUCTED: {total_conducted}*"
-
-    return message
-
+        store_metric(name, "calculated_appointments_booked", booked, "count", "Calendly")
+        store_metric(name, "calculated_appointments_canceled", canceled, "count", "Calendly")
+        store_metric(name, "calculated_appointments_conducted", conducted, "count", "Calendly + Zoom")
+        store_metric(name, "calculated_show_rate", show_rate, "percentage", "Calendly + Zoom")
 
-def create_show_rate_message(user_results):
-    """Create Slack message for Show Rate metric"""
-    message = f"""✅ *SHOW RATE (CALCULATED)*
-Date: {(datetime.now(EST) - timedelta(days=1)).strftime('%Y-%m-%d')} (Yesterday)
-Source: Calendly + Zoom Recordings
+    def header(title, source):
+        return f"""✅ *{title}*
+Date: {yesterday_str} (Yesterday)
+Source: {source}
 
 *TEAM PERFORMANCE:*
 """
 
-    # Calculate show rates for each user
-    user_show_rates = []
-    total_booked_all = 0
-    total_conducted_all = 0
-
-    for name, result in user_results.items():
-        booked = result["scheduled_count"]
-        conducted = result["conducted_count"]
-        show_rate = (conducted / booked * 100) if booked > 0 else 0
-
-        user_show_rates.append((name, show_rate, booked, conducted))
-        total_booked_all += booked
-        total_conducted_all += conducted
+    # Appointments booked, sorted by booked count (highest first)
+    booked_parts = [header("TOTAL APPOINTMENTS BOOKED (CALCULATED)", "Calendly API")]
+    for name, booked, canceled, _, _ in sorted(rows, key=lambda r: r[1], reverse=True):
+        booked_parts.append(f"• {name.title()}: {booked} appointments\n")
+        if canceled > 0:
+            booked_parts.append(f"  ↳ Canceled: {canceled}\n")
+    booked_parts.append(f"\n*TOTAL BOOKED: {total_booked}*")
+    if total_canceled > 0:
+        booked_parts.append(f"\n*TOTAL CANCELED: {total_canceled}*")
 
-        # Store calculated metrics
-        store_metric(name, "calculated_show_rate", show_rate, "percentage", "Calendly + Zoom")
+    # Appointments conducted, sorted by conducted count (highest first)
+    conducted_parts = [header("TOTAL APPOINTMENTS CONDUCTED (CALCULATED)", "Calendly + Zoom Recordings")]
+    for name, _, _, conducted, _ in sorted(rows, key=lambda r: r[3], reverse=True):
+        conducted_parts.append(f"• {name.title()}: {conducted} appointments\n")
+    conducted_parts.append(f"\n*TOTAL CONDUCTED: {total_conducted}*")
 
-    # Sort by show rate (highest first)
-    user_show_rates.sort(key=lambda x: x[1], reverse=True)
-
-    for name, show_rate, booked, conducted in user_show_rates:
-        display_name = name.title()
-        message += (
-            f"• {display_name}: {show_rate:.1f}% ({conducted}/{booked})\n"
-        )
+    # Show rate, sorted by show rate (highest first)
+    show_rate_parts = [header("SHOW RATE (CALCULATED)", "Calendly + Zoom Recordings")]
+    for name, booked, _, conducted, show_rate in sorted(rows, key=lambda r: r[4], reverse=True):
+        show_rate_parts.append(f"• {name.title()}: {show_rate:.1f}% ({conducted}/{booked})\n")
 
     # Calculate overall show rate
     overall_show_rate = (
-        (total_conducted_all / total_booked_all * 100)
-        if total_booked_all > 0
-        else 0
+        (total_conducted / total_booked * 100) if total_booked > 0 else 0
     )
-    message += f"\n*OVERALL SHOW RATE: {overall_show_rate:.1f}% ({total_conducted_all}/{total_booked_all})*"
+    show_rate_parts.append(f"\n*OVERALL SHOW RATE: {overall_show_rate:.1f}% ({total_conducted}/{total_booked})*")
+
+    return {
+        "booked": "".join(booked_parts),
+        "conducted": "".join(conducted_parts),
+        "show_rate": "".join(show_rate_parts),
+    }
+
 
-    return message
+# Canonical rep keys for average deal size, and the (normalized) names each goes by
+DEAL_SIZE_REP_VARIANTS = {
+    "sierra": ["sierra", "sierra campbell"],
+    "mikaela": ["mikaela", "mikaela gordon"],
+    "mike": ["mike", "mike hammer"],
+}
+# variant -> (rep key, rank of the variant within that rep's list)
+DEAL_SIZE_VARIANT_TO_REP = {
+    variant: (rep_key, rank)
+    for rep_key, variants in DEAL_SIZE_REP_VARIANTS.items()
+    for rank, variant in enumerate(variants)
+}
 
 
-def calculate_average_deal_size():
+def calculate_average_deal_size(rows=None, today_revenue=None, today_deal_counts=None):
     """
     Average Deal Size (NEW CLIENT sales only).
     Relies on:
-        • new_client_revenue_grouped – today's $ per rep
-        • new_clients_counts        – today's deal count per rep
-        • MASTER_SHEET_ID           – cumulative sheet
+        • today_revenue     – today's $ per rep (defaults to run_state's new_client_revenue_grouped)
+        • today_deal_counts – today's deal count per rep (defaults to run_state's new_clients_counts)
+        • MASTER_SHEET_ID   – cumulative sheet ("A:K" rows, fetched if not given)
     Returns {rep: avg $, ..., 'team_avg': $}
     """
+    if today_revenue is None:
+        today_revenue = run_state["new_client_revenue_grouped"]
+    if today_deal_counts is None:
+        today_deal_counts = run_state["new_clients_counts"]
+
     # ---------- pull cumulative revenue + deals ----------
-    rows = (
-        sheet.values()
-        .get(
-            spreadsheetId=MASTER_SHEET_ID,
-            range="A:K",  # col A = name, F = new-client count, J = revenue
-        )
-        .execute()
-        .get("values", [])
+    if rows is None:
+        # col A = name, F = new-client count, J = revenue
+        rows = fetch_master_ranges(["A:K"])["A:K"]
+
+    # parse the name / deals / revenue columns whole; short rows are padded with None
+    frame = pd.DataFrame(rows[1:]).reindex(columns=range(10))
+    names = frame[0].fillna("").astype(str).str.strip().str.lower()
+    deals = parse_numeric_series(frame[5])
+    revs = parse_currency_series(frame[9])
+
+    keep = (names != "") & (names != "jason")
+    cum_rev_deals = dict(
+        zip(names[keep], zip(revs[keep].tolist(), deals[keep].tolist()))
     )
 
-    # helper → "sierra campbell" → "sierra campbell"
-    norm = lambda s: str(s or "").strip().lower()
-
-    cum_rev_deals = {}
-    for r in rows[1:]:
-        name = norm(r[0]) if len(r) > 0 else ""
-        deals = parse_numeric_value(r[5]) if len(r) > 5 else 0
-        rev = parse_currency_value(r[9]) if len(r) > 9 else 0
-        if name and name != "jason":
-            cum_rev_deals[name] = (rev, deals)
-
-    # ---------- today's dicts ----------
-    today_rev = {
-        norm(k): v
-        for k, v in globals().get("new_client_revenue_grouped", {}).items()
-    }
-    today_deals = {
-        norm(k): v for k, v in globals().get("new_clients_counts", {}).items()
-    }
-
-    # canonical rep keys we'll return
-    canonical = {
-        "sierra": ["sierra", "sierra campbell"],
-        "mikaela": ["mikaela", "mikaela gordon"],
-        "mike": ["mike", "mike hammer"],
-    }
+    # ---------- today's dicts, keyed by normalized name ("Sierra Campbell " → "sierra campbell") ----------
+    today_rev = {normalize_name(k): v for k, v in today_revenue.items()}
+    today_deals = {normalize_name(k): v for k, v in today_deal_counts.items()}
+
+    # cumulative: the first-listed variant present wins; keep (rank, rev, deals) per rep
+    cum_by_rep = {}
+    for name, (rev, deals) in cum_rev_deals.items():
+        hit = DEAL_SIZE_VARIANT_TO_REP.get(name)
+        if hit:
+            rep_key, rank = hit
+            if rep_key not in cum_by_rep or rank < cum_by_rep[rep_key][0]:
+                cum_by_rep[rep_key] = (rank, rev, deals)
+
+    # today: every variant of a rep counts
+    today_rev_by_rep = dict.fromkeys(DEAL_SIZE_REP_VARIANTS, 0)
+    today_deals_by_rep = dict.fromkeys(DEAL_SIZE_REP_VARIANTS, 0)
+    for name, rev in today_rev.items():
+        hit = DEAL_SIZE_VARIANT_TO_REP.get(name)
+        if hit:
+            today_rev_by_rep[hit[0]] += rev
+    for name, deals in today_deals.items():
+        hit = DEAL_SIZE_VARIANT_TO_REP.get(name)
+        if hit:
+            today_deals_by_rep[hit[0]] += deals
 
     averages = {}
-    for rep_key, name_variants in canonical.items():
-        # try each variant until we find a match in the cumulative dict
-        cum_rev = cum_deals = 0
-        for variant in name_variants:
-            if variant in cum_rev_deals:
-                cum_rev, cum_deals = cum_rev_deals[variant]
-                break
-
-        total_rev = cum_rev + sum(today_rev.get(v, 0) for v in name_variants)
-        total_deals = cum_deals + sum(
-            today_deals.get(v, 0) for v in name_variants
-        )
+    for rep_key in DEAL_SIZE_REP_VARIANTS:
+        _, cum_rev, cum_deals = cum_by_rep.get(rep_key, (0, 0, 0))
+
+        total_rev = cum_rev + today_rev_by_rep[rep_key]
+        total_deals = cum_deals + today_deals_by_rep[rep_key]
 
         avg_size = (total_rev / total_deals) if total_deals else 0
         averages[rep_key] = avg_size
@@ -1781,48 +2256,51 @@ def calculate_average_deal_size():
     return averages
 
 
-def create_deal_size_message(deal_size_dict):
+def create_deal_size_message(deal_size_dict, yesterday=None):
     """
     Build a Slack-ready message summarizing Average Deal Size (new-client sales).
     """
     if not deal_size_dict:
         return "No deal-size data available."
+    if yesterday is None:
+        yesterday = get_yesterday_est()
 
-    # Pull and remove optional 'team_avg'
-    team_avg = deal_size_dict.pop("team_avg", None)
+    # Read optional 'team_avg' without mutating the caller's dict
+    team_avg = deal_size_dict.get("team_avg")
+    reps = {k: v for k, v in deal_size_dict.items() if k != "team_avg"}
 
     # Sort reps by avg deal size, highest first
-    sorted_reps = sorted(deal_size_dict.items(), key=lambda x: -x[1])
+    sorted_reps = sorted(reps.items(), key=itemgetter(1), reverse=True)
 
-    msg = f"""✅ *AVERAGE DEAL SIZE (NEW CLIENTS) - CALCULATED*
-Date: {(datetime.now(EST) - timedelta(days=1)).strftime('%Y-%m-%d')} (Yesterday)
+    parts = [f"""✅ *AVERAGE DEAL SIZE (NEW CLIENTS) - CALCULATED*
+Date: {yesterday.strftime('%Y-%m-%d')} (Yesterday)
 Source: Master Sheet + Sales Data
 
 *TEAM PERFORMANCE:*
-"""
-    for rep, avg in sorted_reps:
-        msg += f"• {rep.title()}: ${avg:,.0f}\n"
+"""]
+    parts.extend(f"• {rep.title()}: ${avg:,.0f}\n" for rep, avg in sorted_reps)
 
     # Fallback: compute team average if not supplied
-    if team_avg is None and deal_size_dict:
-        team_avg = sum(deal_size_dict.values()) / len(deal_size_dict)
+    if team_avg is None and reps:
+        team_avg = sum(reps.values()) / len(reps)
 
     if team_avg is not None:
-        msg += f"\n*TEAM AVERAGE DEAL SIZE: ${team_avg:,.0f}*"
+        parts.append(f"\n*TEAM AVERAGE DEAL SIZE: ${team_avg:,.0f}*")
 
-    return msg
+    return "".join(parts)
 
 
-def create_metric_slack_message(metric_name, metric_display_name, metric_type="count"):
+def create_metric_slack_message(metric_name, metric_display_name, metric_type="count", yesterday=None):
     """Create a Slack message for a specific metric from master sheet"""
-    yesterday = (datetime.now(EST) - timedelta(days=1)).date()
+    if yesterday is None:
+        yesterday = get_yesterday_est()
 
-    message = f"""✅ *{metric_display_name.upper()}*
+    parts = [f"""✅ *{metric_display_name.upper()}*
 Date: {yesterday.strftime('%Y-%m-%d')} (Yesterday)
 Source: Master Sheet
 
 *TEAM PERFORMANCE:*
-"""
+"""]
 
     # Collect data for all reps
     rep_data = []
@@ -1842,22 +2320,65 @@ Source: Master Sheet
     for rep_name, value in rep_data:
         display_name = rep_name.title()
         if metric_type == "currency":
-            message += f"• {display_name}: ${value:,.0f}\n"
+            parts.append(f"• {display_name}: ${value:,.0f}\n")
         elif metric_type == "percentage":
-            message += f"• {display_name}: {value:.1f}%\n"
+            parts.append(f"• {display_name}: {value:.1f}%\n")
         else:
-            message += f"• {display_name}: {int(value)}\n"
+            parts.append(f"• {display_name}: {int(value)}\n")
 
     # Add total if applicable
     if metric_type == "currency" and total_value > 0:
-        message += f"\n*TOTAL: ${total_value:,.0f}*"
+        parts.append(f"\n*TOTAL: ${total_value:,.0f}*")
     elif metric_type == "count" and total_value > 0:
-        message += f"\n*TOTAL: {int(total_value)}*"
+        parts.append(f"\n*TOTAL: {int(total_value)}*")
     elif metric_type == "percentage" and rep_data:
         avg_value = sum(x[1] for x in rep_data) / len(rep_data)
-        message += f"\n*AVERAGE: {avg_value:.1f}%*"
+        parts.append(f"\n*AVERAGE: {avg_value:.1f}%*")
+
+    return "".join(parts)
+
 
-    return message
+def find_earliest_master_sheet(sheets):
+    """
+    Return (sheet name, date) of the earliest daily sub-sheet ("July 12") in the
+    master sheet, or (None, None). Its rows are the historical baseline that the
+    running calculations build on.
+    """
+    earliest_sheet = None
+    earliest_date = None
+    # Use current year for comparison
+    current_year = datetime.now().year
+    
+    for sheet_info in sheets:
+        sheet_name = sheet_info["properties"]["title"]
+        
+        # Skip master/summary sheets
+        if any(keyword in sheet_name.lower() for keyword in ["master", "summary", "overview"]):
+            continue
+        
+        # Try to parse date from sheet name
+        try:
+            # Handle formats like "July 1", "July 12", etc.
+            parts = sheet_name.split()
+            if len(parts) >= 2:
+                month_name = parts[0]
+                day_num = int(parts[1])
+                
+                # Get month number
+                month_num = _FULL_MONTH_NUMBERS.get(month_name)
+                if month_num is None:
+                    continue
+                
+                sheet_date = datetime(current_year, month_num, day_num)
+                
+                if earliest_date is None or sheet_date < earliest_date:
+                    earliest_date = sheet_date
+                    earliest_sheet = sheet_name
+                    
+        except (ValueError, IndexError):
+            continue
+    
+    return earliest_sheet, earliest_date
 
 
 def get_master_sheet_historical_data():
@@ -1870,52 +2391,14 @@ def get_master_sheet_historical_data():
         print(f"  Fetching historical data from master sheet: {MASTER_SHEET_ID}")
         
         # Get all sheets information to find the earliest sheet
-        spreadsheet_metadata = (
-            service.spreadsheets()
-            .get(spreadsheetId=MASTER_SHEET_ID, fields="sheets.properties")
-            .execute()
-        )
-        sheets = spreadsheet_metadata.get("sheets", [])
+        sheets = get_master_sheets()
         
         if not sheets:
             print("    No sheets found in master sheet.")
             return {}
         
         # Find the earliest sheet (skip master sheets)
-        earliest_sheet = None
-        earliest_date = None
-        
-        for sheet_info in sheets:
-            sheet_name = sheet_info["properties"]["title"]
-            
-            # Skip master/summary sheets
-            if any(keyword in sheet_name.lower() for keyword in ["master", "summary", "overview"]):
-                continue
-            
-            # Try to parse date from sheet name
-            try:
-                # Handle formats like "July 1", "July 12", etc.
-                from datetime import datetime
-                import calendar
-                
-                parts = sheet_name.split()
-                if len(parts) >= 2:
-                    month_name = parts[0]
-                    day_num = int(parts[1])
-                    
-                    # Get month number
-                    month_num = list(calendar.month_name).index(month_name)
-                    
-                    # Use current year for comparison
-                    current_year = datetime.now().year
-                    sheet_date = datetime(current_year, month_num, day_num)
-                    
-                    if earliest_date is None or sheet_date < earliest_date:
-                        earliest_date = sheet_date
-                        earliest_sheet = sheet_name
-                        
-            except (ValueError, IndexError):
-                continue
+        earliest_sheet, _ = find_earliest_master_sheet(sheets)
         
         if not earliest_sheet:
             print("    No date-based sheets found in master sheet.")
@@ -1942,9 +2425,6 @@ def get_master_sheet_historical_data():
         
         print(f"    Found {len(values)} rows in earliest sheet")
         
-        # helper → normalize names
-        norm = lambda s: str(s or "").strip().lower()
-        
         historical_data = {}
         
         # Process rows to extract historical data
@@ -1952,7 +2432,7 @@ def get_master_sheet_historical_data():
             if len(r) == 0:
                 continue
                 
-            name = norm(r[0]) if len(r) > 0 else ""
+            name = normalize_name(r[0]) if len(r) > 0 else ""
             if not name or name == "jason" or "team total" in name:
                 continue
             
@@ -1968,13 +2448,7 @@ def get_master_sheet_historical_data():
             total_revenue = parse_currency_value(r[11]) if len(r) > 11 else 0  # Column L - total revenue
             
             # Map to canonical rep names
-            rep_name = None
-            if "mikaela" in name:
-                rep_name = "mikaela"
-            elif "mike" in name or "hammer" in name:
-                rep_name = "mike"
-            elif "sierra" in name:
-                rep_name = "sierra"
+            rep_name = master_rep_name(name)
             
             if rep_name:
                 historical_data[rep_name] = {
@@ -2000,13 +2474,162 @@ def get_master_sheet_historical_data():
         return {}
 
 
-# --- MASTER SHEET WRITE FUNCTIONS ---
-def create_sheet_name_for_date(date_obj):
-    """Create sheet name in format 'July 12' for a given date"""
-    return date_obj.strftime("%B %-d")
+# --- MASTER SHEET WRITE FUNCTIONS ---
+def create_sheet_name_for_date(date_obj):
+    """Create sheet name in format 'July 12' for a given date"""
+    return date_obj.strftime("%B %-d")
+
+# Column headers for each daily sub-sheet in the master sheet
+MASTER_SHEET_HEADERS = [
+    "SALES REP",
+    "Total Appointments Booked", 
+    "Total Appointments Conducted",
+    "New Clients Closed",
+    "New Clients Closed (Organic)",
+    "Total New Clients Closed",
+    "Total Rebuys",
+    "Daily Show Percentage",
+    "Running Close Rate (Sit->Sale)",
+    "NEW CLIENT REVENUE",
+    "REBUY REVENUE", 
+    "TOTAL REVENUE COLLECTED (NEW CLIENT + REBUY)",
+    "RUNNING AVERAGE DEAL SIZE (NEW CLIENT SALES ONLY)"
+]
+
+
+def build_master_sheet_rows(daily_metrics, date_str):
+    """Build the header, rep and team-total rows for one date's sub-sheet"""
+    data_rows = [MASTER_SHEET_HEADERS]
+    
+    # Add data for each representative
+    for rep_name in ['Mikaela Gordon', 'Mike Hammer', 'Sierra Campbell']:
+        rep_key = rep_name.split()[0].lower()  # mikaela, mike, sierra
+        
+        metrics = daily_metrics.get(rep_key, {}).get(date_str)
+        if metrics is not None:
+            row = [
+                rep_name,
+                metrics.get('appointments_booked', 0),
+                metrics.get('appointments_conducted', 0),
+                metrics.get('new_clients_closed', 0),
+                metrics.get('new_clients_closed_organic', 0),
+                metrics.get('total_new_clients_closed', 0),
+                metrics.get('total_rebuys', 0),
+                format_percentage(metrics.get('running_show_percentage', 0)),
+                format_percentage(metrics.get('running_close_rate', 0)),
+                format_currency(metrics.get('new_client_revenue', 0)),
+                format_currency(metrics.get('rebuy_revenue', 0)),
+                format_currency(metrics.get('total_revenue', 0)),
+                format_currency(metrics.get('average_deal_size', 0))
+            ]
+        else:
+            # No data for this rep - use zeros
+            row = [
+                rep_name,
+                0, 0, 0, 0, 0, 0,
+                "0.00%", "0.00%",
+                "$0.00", "$0.00", "$0.00", "$0.00"
+            ]
+        
+        data_rows.append(row)
+    
+    # Add team totals row
+    team_data = daily_metrics.get('TEAM_TOTALS', {}).get(date_str)
+    if team_data is not None:
+        team_row = [
+            "TEAM TOTAL",
+            team_data.get('Appointments Booked', 0),
+            team_data.get('Appointments Conducted', 0),
+            team_data.get('New Clients Closed', 0),
+            team_data.get('New Clients Closed (Organic)', 0),
+            team_data.get('Total New Clients Closed', 0),
+            team_data.get('Total Rebuys', 0),
+            format_percentage(team_data.get('Daily Show Percentage', 0)),
+            format_percentage(team_data.get('Running Close Rate', 0)),
+            format_currency(team_data.get('New Client Revenue', 0)),
+            format_currency(team_data.get('Rebuy Revenue', 0)),
+            format_currency(team_data.get('Total Revenue', 0)),
+            format_currency(team_data.get('Average Deal Size', 0))
+        ]
+        data_rows.append(team_row)
+    
+    return data_rows
+
+
+def write_rows_to_master_sheet(rows_by_sheet):
+    """
+    Write {sheet_name: rows} to the master sheet in one round trip.
+    Missing sub-sheets are created with a single batchUpdate and all values
+    are written with a single values.batchUpdate call. Rate-limit (429) and
+    server errors on the (idempotent) values write are retried with jittered
+    exponential backoff.
+    """
+    # Check which sheets already exist
+    existing_sheets = {sheet["properties"]["title"] for sheet in get_master_sheets()}
+    
+    # Create all missing sheets at once
+    add_sheet_requests = []
+    for sheet_name in rows_by_sheet:
+        if sheet_name in existing_sheets:
+            print(f"  Sheet '{sheet_name}' already exists - will overwrite data")
+            continue
+        
+        print(f"  Creating new sheet: '{sheet_name}'")
+        add_sheet_requests.append({
+            "addSheet": {
+                "properties": {
+                    "title": sheet_name,
+                    "gridProperties": {
+                        "rowCount": 20,
+                        "columnCount": 15
+                    }
+                }
+            }
+        })
+    
+    if add_sheet_requests:
+        # addSheet is not idempotent, so it is sent once without retries: a
+        # retry after a lost response would fail with 400 "already exists"
+        try:
+            service.spreadsheets().batchUpdate(
+                spreadsheetId=MASTER_SHEET_ID,
+                body={"requests": add_sheet_requests}
+            ).execute()
+        except HttpError as err:
+            if err.resp.status != 400:
+                raise
+            # The sheets may have been created by an earlier attempt; carry on
+            # if they all exist now
+            invalidate_master_sheets()
+            existing_sheets = {sheet["properties"]["title"] for sheet in get_master_sheets()}
+            if not all(sheet_name in existing_sheets for sheet_name in rows_by_sheet):
+                raise
+            print("  Sheet(s) already exist - continuing with the write")
+        else:
+            print(f"  ✅ Created {len(add_sheet_requests)} sheet(s) successfully")
+        invalidate_master_sheets()
+    
+    # Write every sheet's rows in a single request
+    body = {
+        'valueInputOption': 'USER_ENTERED',  # This will interpret formulas and format numbers
+        'data': [
+            {'range': f"'{sheet_name}'!A1", 'values': rows}
+            for sheet_name, rows in rows_by_sheet.items()
+        ]
+    }
+    
+    return service.spreadsheets().values().batchUpdate(
+        spreadsheetId=MASTER_SHEET_ID,
+        body=body
+    ).execute(num_retries=SHEETS_NUM_RETRIES)
+
 
-def write_daily_data_to_master_sheet(daily_sales_data):
-    """Write daily sales data to master sheet in a new sub-sheet"""
+def write_daily_data_to_master_sheet(daily_sales_data, yesterday=None, yesterday_str=None):
+    """
+    Write daily sales data to master sheet in a new sub-sheet.
+    Callers that already resolved the target date can pass it (and its
+    'YYYY-MM-DD' string) to avoid recomputing them here.
+    """
     if not MASTER_SHEET_ID:
         print("Warning: MASTER_SHEET_ID not found. Cannot write to master sheet.")
         return False
@@ -2017,142 +2640,20 @@ def write_daily_data_to_master_sheet(daily_sales_data):
     
     try:
         # Get yesterday's date and create sheet name
-        yesterday = get_yesterday_est()
+        if yesterday is None:
+            yesterday = get_yesterday_est()
+        if yesterday_str is None:
+            yesterday_str = yesterday.strftime('%Y-%m-%d')
         sheet_name = create_sheet_name_for_date(yesterday)
         
         print(f"\n📝 Writing daily data to master sheet: '{sheet_name}'")
         
-        # Check if sheet already exists
-        spreadsheet_metadata = (
-            service.spreadsheets()
-            .get(spreadsheetId=MASTER_SHEET_ID, fields="sheets.properties")
-            .execute()
-        )
-        existing_sheets = [sheet["properties"]["title"] for sheet in spreadsheet_metadata.get("sheets", [])]
-        
-        # Create new sheet if it doesn't exist
-        if sheet_name not in existing_sheets:
-            print(f"  Creating new sheet: '{sheet_name}'")
-            
-            # Create new sheet
-            add_sheet_request = {
-                "addSheet": {
-                    "properties": {
-                        "title": sheet_name,
-                        "gridProperties": {
-                            "rowCount": 20,
-                            "columnCount": 15
-                        }
-                    }
-                }
-            }
-            
-            batch_update_request = {
-                "requests": [add_sheet_request]
-            }
-            
-            service.spreadsheets().batchUpdate(
-                spreadsheetId=MASTER_SHEET_ID,
-                body=batch_update_request
-            ).execute()
-            
-            print(f"  ✅ Sheet '{sheet_name}' created successfully")
-        else:
-            print(f"  Sheet '{sheet_name}' already exists - will overwrite data")
-        
         # Prepare data for writing
-        daily_metrics = daily_sales_data['daily_metrics']
-        yesterday_str = yesterday.strftime('%Y-%m-%d')
-        
-        # Headers based on the screenshot
-        headers = [
-            "SALES REP",
-            "Total Appointments Booked", 
-            "Total Appointments Conducted",
-            "New Clients Closed",
-            "New Clients Closed (Organic)",
-            "Total New Clients Closed",
-            "Total Rebuys",
-            "Daily Show Percentage",
-            "Running Close Rate (Sit->Sale)",
-            "NEW CLIENT REVENUE",
-            "REBUY REVENUE", 
-            "TOTAL REVENUE COLLECTED (NEW CLIENT + REBUY)",
-            "RUNNING AVERAGE DEAL SIZE (NEW CLIENT SALES ONLY)"
-        ]
+        data_rows = build_master_sheet_rows(daily_sales_data['daily_metrics'], yesterday_str)
         
-        # Prepare data rows
-        data_rows = [headers]
+        result = write_rows_to_master_sheet({sheet_name: data_rows})
         
-        # Add data for each representative
-        for rep_name in ['Mikaela Gordon', 'Mike Hammer', 'Sierra Campbell']:
-            rep_key = rep_name.split()[0].lower()  # mikaela, mike, sierra
-            
-            if rep_key in daily_metrics and yesterday_str in daily_metrics[rep_key]:
-                metrics = daily_metrics[rep_key][yesterday_str]
-                
-                row = [
-                    rep_name,
-                    metrics.get('appointments_booked', 0),
-                    metrics.get('appointments_conducted', 0),
-                    metrics.get('new_clients_closed', 0),
-                    metrics.get('new_clients_closed_organic', 0),
-                    metrics.get('total_new_clients_closed', 0),
-                    metrics.get('total_rebuys', 0),
-                    f"{metrics.get('running_show_percentage', 0):.2f}%",
-                    f"{metrics.get('running_close_rate', 0):.2f}%",
-                    f"${metrics.get('new_client_revenue', 0):,.2f}",
-                    f"${metrics.get('rebuy_revenue', 0):,.2f}",
-                    f"${metrics.get('total_revenue', 0):,.2f}",
-                    f"${metrics.get('average_deal_size', 0):,.2f}"
-                ]
-            else:
-                # No data for this rep - use zeros
-                row = [
-                    rep_name,
-                    0, 0, 0, 0, 0, 0,
-                    "0.00%", "0.00%",
-                    "$0.00", "$0.00", "$0.00", "$0.00"
-                ]
-            
-            data_rows.append(row)
-        
-        # Add team totals row
-        if 'TEAM_TOTALS' in daily_metrics and yesterday_str in daily_metrics['TEAM_TOTALS']:
-            team_data = daily_metrics['TEAM_TOTALS'][yesterday_str]
-            
-            team_row = [
-                "TEAM TOTAL",
-                team_data.get('Appointments Booked', 0),
-                team_data.get('Appointments Conducted', 0),
-                team_data.get('New Clients Closed', 0),
-                team_data.get('New Clients Closed (Organic)', 0),
-                team_data.get('Total New Clients Closed', 0),
-                team_data.get('Total Rebuys', 0),
-                f"{team_data.get('Daily Show Percentage', 0):.2f}%",
-                f"{team_data.get('Running Close Rate', 0):.2f}%",
-                f"${team_data.get('New Client Revenue', 0):,.2f}",
-                f"${team_data.get('Rebuy Revenue', 0):,.2f}",
-                f"${team_data.get('Total Revenue', 0):,.2f}",
-                f"${team_data.get('Average Deal Size', 0):,.2f}"
-            ]
-            data_rows.append(team_row)
-        
-        # Write data to the sheet
-        range_name = f"'{sheet_name}'!A1"
-        
-        body = {
-            'values': data_rows
-        }
-        
-        result = service.spreadsheets().values().update(
-            spreadsheetId=MASTER_SHEET_ID,
-            range=range_name,
-            valueInputOption='USER_ENTERED',  # This will interpret formulas and format numbers
-            body=body
-        ).execute()
-        
-        print(f"  ✅ Data written successfully: {result.get('updatedCells', 0)} cells updated")
+        print(f"  ✅ Data written successfully: {result.get('totalUpdatedCells', 0)} cells updated")
         print(f"  📊 Wrote data for {len(data_rows)-1} rows (including team totals)")
         
         return True
@@ -2166,125 +2667,138 @@ def write_daily_data_to_master_sheet(daily_sales_data):
             print(f"   Current operation attempted: Create new sheet '{sheet_name}' and write data")
         else:
             print(f"❌ Error writing to master sheet: {e}")
-            import traceback
             traceback.print_exc()
         return False
 
 
-def get_appointments_by_date(date_range):
-    """Get appointment data by date for each representative"""
-    # Get organization URI
-    org_uuid = os.getenv("ORG_UUID")
-    org_uri = f"https://api.calendly.com/organizations/{org_uuid}"
+def get_user_appointments_by_date(name, mappings, date_range, org_uri, zoom_token):
+    """Get booked/conducted counts by date for a single representative"""
+    print(f"  Processing {name.title()}...")
 
-    # Get Zoom access token
-    zoom_token = get_zoom_access_token()
+    # Initialize all dates with zero counts
+    appointments_by_date = {}
+    for date in date_range:
+        date_str = date.strftime('%Y-%m-%d')
+        appointments_by_date[date_str] = {
+            'booked': 0,
+            'conducted': 0
+        }
 
-    # Results storage by rep and date
-    appointments_by_date_by_rep = {}
+    # Get Calendly events for the entire date range
+    user_uri = f"https://api.calendly.com/users/{mappings['calendly_uuid']}"
+    
+    try:
+        # Get events for the date range
+        active_events, canceled_events = get_calendly_events_for_date_range(user_uri, org_uri, date_range[0], date_range[-1])
+        
+        # Group active and canceled events by date
+        all_events = active_events + canceled_events
+        for event in all_events:
+            event_date = event['start_time'].date()
+            event_date_str = event_date.strftime('%Y-%m-%d')
+            if event_date_str in appointments_by_date:
+                appointments_by_date[event_date_str]['booked'] += 1
 
-    for name, mappings in USER_MAPPINGS.items():
-        if not mappings["calendly_uuid"]:
-            continue
+    except Exception as e:
+        print(f"    Error fetching Calendly events for {name}: {e}")
+        active_events = []
+        canceled_events = []
 
-        print(f"  Processing {name.title()}...")
-        appointments_by_date_by_rep[name] = {}
+    # Include both active and canceled events
+    all_events = active_events + canceled_events
 
-        # Initialize all dates with zero counts
-        for date in date_range:
-            date_str = date.strftime('%Y-%m-%d')
-            appointments_by_date_by_rep[name][date_str] = {
-                'booked': 0,
-                'conducted': 0
-            }
+    # Nothing to match without Calendly events - skip the Zoom calls
+    if not all_events:
+        return appointments_by_date
 
-        # Get Calendly events for the entire date range
-        user_uri = f"https://api.calendly.com/users/{mappings['calendly_uuid']}"
-        
+    # Get Zoom recordings for the date range
+    zoom_user_id = get_zoom_user_id_by_email(mappings["zoom_email"], zoom_token)
+    if zoom_user_id:
         try:
-            # Get events for the date range
-            active_events, canceled_events = get_calendly_events_for_date_range(user_uri, org_uri, date_range[0], date_range[-1])
+            zoom_meetings = get_zoom_meetings_for_date_range(zoom_user_id, mappings["zoom_email"], zoom_token, date_range[0], date_range[-1])
+            
+            # Match events with recordings by date (with transcript verification)
+            matched_by_date = match_events_with_meetings_by_date(all_events, zoom_meetings, name, zoom_token)
             
-            # Group active and canceled events by date
-            all_events = active_events + canceled_events
-            for event in all_events:
-                event_date = event['start_time'].date()
-                event_date_str = event_date.strftime('%Y-%m-%d')
-                if event_date_str in appointments_by_date_by_rep[name]:
-                    appointments_by_date_by_rep[name][event_date_str]['booked'] += 1
+            # Add conducted counts by date
+            for date_str, conducted_count in matched_by_date.items():
+                if date_str in appointments_by_date:
+                    appointments_by_date[date_str]['conducted'] = conducted_count
 
         except Exception as e:
-            print(f"    Error fetching Calendly events for {name}: {e}")
-            active_events = []
-
-        # Get Zoom recordings for the date range
-        zoom_user_id = get_zoom_user_id_by_email(mappings["zoom_email"], zoom_token)
-        if zoom_user_id:
-            try:
-                zoom_meetings = get_zoom_meetings_for_date_range(zoom_user_id, mappings["zoom_email"], zoom_token, date_range[0], date_range[-1])
-                
-                # Match events with recordings by date (with transcript verification)
-                # Include both active and canceled events
-                all_events = active_events + canceled_events
-                matched_by_date = match_events_with_meetings_by_date(all_events, zoom_meetings, name, zoom_token)
-                
-                # Add conducted counts by date
-                for date_str, conducted_count in matched_by_date.items():
-                    if date_str in appointments_by_date_by_rep[name]:
-                        appointments_by_date_by_rep[name][date_str]['conducted'] = conducted_count
-
-            except Exception as e:
-                print(f"    Error processing Zoom data for {name}: {e}")
-
-    return appointments_by_date_by_rep
+            print(f"    Error processing Zoom data for {name}: {e}")
 
+    return appointments_by_date
 
-# --- MAIN EXECUTION FUNCTIONS ---
-def analyze_appointments():
-    """Analyze appointments from Calendly and Zoom"""
-    print("\n" + "=" * 80)
-    print("PROCESSING APPOINTMENT DATA...")
-    print(
-        f"Processing data for: {(datetime.now(EST) - timedelta(days=1)).strftime('%Y-%m-%d')} (Yesterday)"
-    )
-    print("=" * 80)
 
+def get_appointments_by_date(date_range):
+    """
+    Get appointment data by date for each representative.
+    Reps are processed concurrently since each one is a chain of independent
+    Calendly/Zoom HTTP calls.
+    """
     # Get organization URI
-    org_uuid = os.getenv("ORG_UUID")
-    org_uri = f"https://api.calendly.com/organizations/{org_uuid}"
+    org_uri = CALENDLY_ORG_URI
 
     # Get Zoom access token
     zoom_token = get_zoom_access_token()
 
-    # Results storage
-    all_results = {}
+    users = [
+        (name, mappings)
+        for name, mappings in USER_MAPPINGS.items()
+        if mappings["calendly_uuid"]
+    ]
+    if not users:
+        return {}
 
-    for name, mappings in USER_MAPPINGS.items():
-        if not mappings["calendly_uuid"]:
-            print(f"\n{name.upper()}: Missing Calendly UUID")
-            continue
+    # Results storage by rep and date
+    with ThreadPoolExecutor(max_workers=len(users)) as executor:
+        futures = {
+            name: executor.submit(
+                get_user_appointments_by_date, name, mappings, date_range, org_uri, zoom_token
+            )
+            for name, mappings in users
+        }
+        appointments_by_date_by_rep = {
+            name: future.result() for name, future in futures.items()
+        }
 
-        print(f"\nProcessing {name.title()}...")
+    return appointments_by_date_by_rep
 
-        # Get Calendly events
-        user_uri = (
-            f"https://api.calendly.com/users/{mappings['calendly_uuid']}"
-        )
-        try:
-            active_events, canceled_events = get_calendly_events_for_user(user_uri, org_uri)
-            all_calendly_events = active_events + canceled_events
-            print(f"  Found {len(active_events)} active Calendly events")
-            print(f"  Found {len(canceled_events)} canceled Calendly events")
-            print(f"  Processing {len(all_calendly_events)} total events for matching")
+
+def get_user_appointment_results(name, mappings, org_uri, zoom_token):
+    """Get yesterday's Calendly events, Zoom recordings and matches for a single representative"""
+    print(f"\nProcessing {name.title()}...")
+
+    # Get Calendly events
+    user_uri = (
+        f"https://api.calendly.com/users/{mappings['calendly_uuid']}"
+    )
+    try:
+        active_events, canceled_events = get_calendly_events_for_user(user_uri, org_uri)
+        all_calendly_events = active_events + canceled_events
+        print(f"  Found {len(active_events)} active Calendly events")
+        print(f"  Found {len(canceled_events)} canceled Calendly events")
+        print(f"  Processing {len(all_calendly_events)} total events for matching")
+        # Each event is printed again while matching, so only list them when debugging
+        if DEBUG:
             for event in active_events:
                 print(f"    - Active: {event['name']} at {event['start_time_str']}")
             for event in canceled_events:
                 print(f"    - Canceled: {event['name']} at {event['start_time_str']}")
-        except Exception as e:
-            print(f"  Error fetching Calendly events for {name}: {e}")
-            active_events = []
-            canceled_events = []
+    except Exception as e:
+        print(f"  Error fetching Calendly events for {name}: {e}")
+        active_events = []
+        canceled_events = []
+
+    # Include both active and canceled events
+    all_events = active_events + canceled_events
 
+    # Nothing to match without Calendly events - skip the Zoom calls
+    if not all_events:
+        print("  No Calendly events - skipping Zoom recordings")
+        zoom_meetings, matched, unmatched = [], [], []
+    else:
         # Get Zoom recordings
         zoom_user_id = get_zoom_user_id_by_email(
             mappings["zoom_email"], zoom_token
@@ -2300,126 +2814,159 @@ def analyze_appointments():
             zoom_meetings = []
 
         # Match events with recordings (with transcript verification)
-        # Include both active and canceled events
-        all_events = active_events + canceled_events
         matched, unmatched = match_events_with_meetings(
             all_events, zoom_meetings, name, zoom_token
         )
 
-        # Store results
-        all_results[name] = {
-            "calendly_events": active_events,
-            "canceled_events": canceled_events,
-            "zoom_meetings": zoom_meetings,
-            "matched_events": matched,
-            "unmatched_events": unmatched,
-            "scheduled_count": len(active_events),
-            "canceled_count": len(canceled_events),
-            "conducted_count": len(matched),
-        }
+    print(
+        f"  Results: {len(matched)} conducted out of {len(active_events)} scheduled (active)"
+    )
 
-        print(
-            f"  Results: {len(matched)} conducted out of {len(active_events)} scheduled (active)"
-        )
+    return {
+        "calendly_events": active_events,
+        "canceled_events": canceled_events,
+        "zoom_meetings": zoom_meetings,
+        "matched_events": matched,
+        "unmatched_events": unmatched,
+        "scheduled_count": len(active_events),
+        "canceled_count": len(canceled_events),
+        "conducted_count": len(matched),
+    }
+
+
+# --- MAIN EXECUTION FUNCTIONS ---
+def analyze_appointments():
+    """Analyze appointments from Calendly and Zoom"""
+    print("\n" + SECTION_SEPARATOR)
+    print("PROCESSING APPOINTMENT DATA...")
+    # One "yesterday" for every message built below, even across midnight
+    yesterday = get_yesterday_est()
+    print(f"Processing data for: {yesterday.strftime('%Y-%m-%d')} (Yesterday)")
+    print(SECTION_SEPARATOR)
+
+    # Get organization URI
+    org_uri = CALENDLY_ORG_URI
+
+    # Get Zoom access token
+    zoom_token = get_zoom_access_token()
+
+    users = []
+    for name, mappings in USER_MAPPINGS.items():
+        if mappings["calendly_uuid"]:
+            users.append((name, mappings))
+        else:
+            print(f"\n{name.upper()}: Missing Calendly UUID")
+
+    # Each rep is a chain of independent Calendly/Zoom calls, so process reps concurrently
+    all_results = {}
+    if users:
+        with ThreadPoolExecutor(max_workers=len(users)) as executor:
+            futures = {
+                name: executor.submit(
+                    get_user_appointment_results, name, mappings, org_uri, zoom_token
+                )
+                for name, mappings in users
+            }
+            all_results = {
+                name: future.result() for name, future in futures.items()
+            }
 
     # Send appointment metrics to Slack
     if all_results:
-        # Send appointments booked
-        slack_message = create_appointments_booked_message(all_results)
-        broadcast_to_slack_users(slack_message)
-
-        # Send appointments conducted
-        slack_message = create_appointments_conducted_message(all_results)
-        broadcast_to_slack_users(slack_message)
+        # Appointments booked, appointments conducted and show rate
+        appointment_messages = create_appointment_messages(all_results, yesterday)
+        slack_messages = [
+            appointment_messages["booked"],
+            appointment_messages["conducted"],
+            appointment_messages["show_rate"],
+        ]
 
-        # Send show rate
-        slack_message = create_show_rate_message(all_results)
-        broadcast_to_slack_users(slack_message)
+        # Read the master-sheet columns used below (A-D for close rate,
+        # A/F/J for deal size) in a single request
+        master_rows = []
+        if MASTER_SHEET_ID:
+            try:
+                print(f"\nFetching data from master sheet: {MASTER_SHEET_ID}")
+                master_rows = fetch_master_ranges(["A:K"])["A:K"]
+            except Exception as e:
+                print(f"Error fetching master sheet data: {e}")
 
         # Calculate and send running close rate
-        master_data = get_master_sheet_data()
-        if master_data:
-            # Create a dictionary of individual user appointments conducted
-            user_appointments_conducted = {
-                name: result["conducted_count"]
-                for name, result in all_results.items()
-            }
-            # Store globally for use in other functions
-            globals()["user_appointments_conducted"] = user_appointments_conducted
+        master_data = get_master_sheet_data(master_rows)
+        # Create a dictionary of individual user appointments conducted
+        user_appointments_conducted = {
+            name: result["conducted_count"]
+            for name, result in all_results.items()
+        }
+        # Keep for later close-rate calculations
+        run_state["user_appointments_conducted"] = user_appointments_conducted
 
-        close_rates = calculate_running_close_rate()
+        close_rates = calculate_running_close_rate(master_data, today_sits=user_appointments_conducted)
         if close_rates:
-            slack_message = create_running_close_rate_message(close_rates)
-            broadcast_to_slack_users(slack_message)
+            slack_messages.append(create_running_close_rate_message(close_rates, yesterday))
 
-        deal_size = calculate_average_deal_size()
+        deal_size = calculate_average_deal_size(master_rows)
         if deal_size:
-            slack_message = create_deal_size_message(deal_size)
-            broadcast_to_slack_users(slack_message)
+            slack_messages.append(create_deal_size_message(deal_size, yesterday))
+
+        # Send all appointment messages in one broadcast
+        broadcast_to_slack_users(*slack_messages)
 
     return all_results
 
 
-def analyze_sales_data_by_date():
-    """Analyze sales data from Google Sheets for yesterday only"""
-    print("\n" + "=" * 80)
-    print("PROCESSING SALES DATA FOR YESTERDAY...")
-    print("=" * 80)
-    
-    # Get yesterday's date
-    yesterday = get_yesterday_est()
+def metrics_columns_for_date(daily_metrics_by_rep, date_str):
+    """
+    Pivot {rep: {date: {metric: value}}} into {metric: [value per rep]} for one
+    date, so team aggregates are a single sum over each metric's column.
+    """
+    rows = [
+        rep_metrics[date_str]
+        for rep, rep_metrics in daily_metrics_by_rep.items()
+        if rep != 'TEAM_TOTALS' and date_str in rep_metrics
+    ]
+    if not rows:
+        return {}
+    return {key: [row[key] for row in rows] for key in rows[0]}
+
+
+def analyze_sales_data_by_date(target_date=None):
+    """
+    Analyze sales data from Google Sheets for a single day.
+    Defaults to yesterday; pass target_date (a date) to backfill another day.
+    """
+    # Get yesterday's date (or the requested backfill date)
+    yesterday = target_date if target_date is not None else get_yesterday_est()
+    day_label = "yesterday" if yesterday == get_yesterday_est() else str(yesterday)
+
+    print("\n" + SECTION_SEPARATOR)
+    print(f"PROCESSING SALES DATA FOR {day_label.upper()}...")
+    print(SECTION_SEPARATOR)
     print(f"Processing data for: {yesterday}")
     
     # We'll calculate appointments by date after we get the data
 
     try:
-        # Get all sheets information
-        spreadsheet_metadata = (
-            service.spreadsheets()
-            .get(spreadsheetId=SPREADSHEET_ID, fields="sheets.properties")
-            .execute()
-        )
-        sheets = spreadsheet_metadata.get("sheets", [])
-
-        if not sheets:
-            print("No sheets found in this spreadsheet.")
-            return {}
-
-        # Get the latest sheet based on date parsing
-        latest_sheet_info = get_latest_sheet(sheets)
+        # Get the sheet whose period covers the date, and its data (shared
+        # across analyses and backfill dates for a few minutes)
+        latest_sheet_title, values = fetch_sales_sheet_for_date(yesterday)
 
-        if not latest_sheet_info:
-            print("Could not determine the latest sheet.")
+        if latest_sheet_title is None:
             return {}
 
-        latest_sheet_title = latest_sheet_info["properties"]["title"]
-
-        # Fetch data from the latest sheet
-        latest_sheet_range = f"'{latest_sheet_title}'!A1:Z"
-        result = (
-            sheet.values()
-            .get(spreadsheetId=SPREADSHEET_ID, range=latest_sheet_range)
-            .execute()
-        )
-        values = result.get("values", [])
-
         if not values:
             print(f"No data found in sheet '{latest_sheet_title}'.")
             return {}
 
         print(f"\nProcessing data from: '{latest_sheet_title}'")
 
-        # Convert to DataFrame for easier processing
-        max_cols = max(len(row) for row in values) if values else 0
-        padded_values = [row + [""] * (max_cols - len(row)) for row in values]
-
-        # Create DataFrame with first row as headers
-        df = pd.DataFrame(padded_values[1:], columns=padded_values[0])
+        # Convert to DataFrame for easier processing (first row as headers)
+        df = sheet_values_to_dataframe(values)
 
         print(f"Total records: {len(df)}")
 
         # Check if required columns exist and map them
-        required_columns = ["Date", "Demo By", "ORGANIC?", "REBUY?", "Deal Amount"]
+        required_columns = DAILY_SALES_REQUIRED_COLUMNS
         column_mapping = map_required_columns(df, required_columns)
 
         missing_columns = [
@@ -2473,13 +3020,15 @@ def analyze_sales_data_by_date():
             except:
                 return None
 
-        df['Date_Parsed'] = df[date_col].apply(parse_date_flexible)
+        # Many rows share a date, so parse each distinct value once and map it back
+        parsed_dates = {value: parse_date_flexible(value) for value in df[date_col].unique()}
+        df['Date_Parsed'] = df[date_col].map(parsed_dates)
         
         # Filter out rows with invalid dates
         df_filtered = df[df['Date_Parsed'].notna()].copy()
         
         # Parse Deal Amount column AFTER filtering
-        df_filtered["Deal Amount Parsed"] = df_filtered[deal_amount_col].apply(parse_currency_value)
+        df_filtered["Deal Amount Parsed"] = parse_currency_series(df_filtered[deal_amount_col])
         
         print(f"Records with valid dates: {len(df_filtered)} out of {len(df)}")
         
@@ -2487,21 +3036,17 @@ def analyze_sales_data_by_date():
             print("No records with valid dates found.")
             return {}
 
-        # Representative name mapping
-        rep_mapping = {
-            'sierra': ['SIERRA', 'SIERRA CAMPBELL', 'SIERRAC'],
-            'mikaela': ['MIKAELA', 'MIKAELA GORDON'],
-            'mike': ['MIKE', 'MIKE HAMMER', 'HAMMER']
-        }
-
         # Filter data to only include yesterday's records
         df_yesterday = df_filtered[df_filtered['Date_Parsed'].dt.date == yesterday].copy()
         
         if len(df_yesterday) == 0:
-            print(f"No sales data found for yesterday ({yesterday})")
+            print(f"No sales data found for {day_label} ({yesterday})")
             return {}
         
-        print(f"Found {len(df_yesterday)} records for yesterday")
+        print(f"Found {len(df_yesterday)} records for {day_label}")
+
+        # Canonical rep for each record (NaN for names that aren't a known variant)
+        record_reps = df_yesterday[demo_by_col].str.lower().map(SALES_NAME_VARIANT_TO_REP)
         
         # Get current month and year from yesterday's date
         current_month = yesterday.month
@@ -2509,18 +3054,26 @@ def analyze_sales_data_by_date():
 
         print(f"Processing data for {current_month}/{current_year}")
 
-        # Get appointment data for yesterday only
-        print("Getting appointment data for yesterday...")
-        appointments_by_date_by_rep = get_appointments_by_date([yesterday])
+        # Get appointment data for yesterday only. The historical master-sheet
+        # read is independent of the Calendly/Zoom calls, so run it in the
+        # background and let its Sheets round trips overlap with them.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            print("Fetching historical data from master sheet...")
+            historical_future = executor.submit(get_master_sheet_historical_data)
+            
+            print(f"Getting appointment data for {day_label}...")
+            appointments_by_date_by_rep = get_appointments_by_date([yesterday])
+            
+            historical_data = historical_future.result()
 
         # Initialize results dictionary
         daily_metrics_by_rep = {}
 
-        for rep in ['sierra', 'mikaela', 'mike']:
+        for rep in SALES_REP_NAME_VARIANTS:
             daily_metrics_by_rep[rep] = {}
 
             # Filter data for this rep from yesterday's data
-            rep_data = df_yesterday[df_yesterday[demo_by_col].str.upper().isin(rep_mapping[rep])]
+            rep_data = df_yesterday[record_reps == rep]
 
             print(f"\nProcessing {len(rep_data)} records for {rep}")
 
@@ -2531,30 +3084,28 @@ def analyze_sales_data_by_date():
             date_group = rep_data  # Already filtered to yesterday above
 
             if len(date_group) > 0:
+                # Empty/has-value masks, computed once per column
+                organic_empty = empty_mask(date_group[organic_col])
+                rebuy_empty = empty_mask(date_group[rebuy_col])
+
                 # 1. New Clients Closed (both ORGANIC? and REBUY? are empty)
-                new_clients = date_group[
-                    date_group[organic_col].apply(is_empty_or_null) &
-                    date_group[rebuy_col].apply(is_empty_or_null)
-                ]
+                new_clients = date_group[organic_empty & rebuy_empty]
 
                 # 2. New Clients Closed (Organic) (ORGANIC? has value, REBUY? is empty)
-                organic_clients = date_group[
-                    date_group[organic_col].apply(has_value) &
-                    date_group[rebuy_col].apply(is_empty_or_null)
-                ]
+                organic_clients = date_group[~organic_empty & rebuy_empty]
 
                 # 3. Total New Clients Closed
                 total_new_clients = len(new_clients) + len(organic_clients)
 
                 # 4. Total Rebuys (REBUY? has value)
-                total_rebuys = len(date_group[date_group[rebuy_col].apply(has_value)])
+                total_rebuys = int((~rebuy_empty).sum())
 
                 # 5. New Client Revenue (REBUY? is empty)
-                new_client_revenue_data = date_group[date_group[rebuy_col].apply(is_empty_or_null)]
+                new_client_revenue_data = date_group[rebuy_empty]
                 new_client_revenue = new_client_revenue_data["Deal Amount Parsed"].sum() if len(new_client_revenue_data) > 0 else 0.0
 
                 # 6. Rebuy Revenue (REBUY? has value)
-                rebuy_revenue_data = date_group[date_group[rebuy_col].apply(has_value)]
+                rebuy_revenue_data = date_group[~rebuy_empty]
                 rebuy_revenue = rebuy_revenue_data["Deal Amount Parsed"].sum() if len(rebuy_revenue_data) > 0 else 0.0
 
                 # 7. Total Revenue
@@ -2599,12 +3150,8 @@ def analyze_sales_data_by_date():
             else:
                 print(f"  {date_str}: No data (all metrics = 0)")
 
-        print(f"\n✅ Daily metrics processing completed for yesterday")
+        print(f"\n✅ Daily metrics processing completed for {day_label}")
 
-        # Get historical data from master sheet for running calculations
-        print("Fetching historical data from master sheet...")
-        historical_data = get_master_sheet_historical_data()
-        
         # Calculate running averages and running close rates (from earliest sheet to current date)
         print("Calculating running averages and running close rates from earliest sheet...")
         for rep in daily_metrics_by_rep:
@@ -2654,58 +3201,31 @@ def analyze_sales_data_by_date():
             print(f"    {rep}: Running Close Rate: {running_close_rate:.1f}% ({running_total_clients}/{running_total_appointments_conducted})")
             print(f"    {rep}: Running Show Rate: {running_show_percentage:.1f}% ({running_total_appointments_conducted}/{running_total_appointments_booked})")
 
-        # Calculate team totals for yesterday
-        team_totals = {}
+        # Calculate team totals for yesterday from a per-metric (columnar) view
         date_str = yesterday.strftime('%Y-%m-%d')
-        
-        # Initialize totals for yesterday
-        team_totals[date_str] = {
-            'New Clients Closed': 0,
-            'New Clients Closed (Organic)': 0,
-            'Total New Clients Closed': 0,
-            'Total Rebuys': 0,
-            'New Client Revenue': 0.0,
-            'Rebuy Revenue': 0.0,
-            'Total Revenue': 0.0,
-            'Average Deal Size': 0.0,
-            'Appointments Booked': 0,
-            'Appointments Conducted': 0,
-            'Daily Show Percentage': 0.0,
-            'Running Close Rate': 0.0
+        columns = metrics_columns_for_date(daily_metrics_by_rep, date_str)
+        reps_with_data = len(columns.get('new_clients_closed', []))
+        
+        def column_average(key):
+            return (sum(columns[key]) / reps_with_data) if reps_with_data > 0 else 0.0
+        
+        team_totals = {
+            date_str: {
+                'New Clients Closed': sum(columns.get('new_clients_closed', [])),
+                'New Clients Closed (Organic)': sum(columns.get('new_clients_closed_organic', [])),
+                'Total New Clients Closed': sum(columns.get('total_new_clients_closed', [])),
+                'Total Rebuys': sum(columns.get('total_rebuys', [])),
+                'New Client Revenue': sum(columns.get('new_client_revenue', []), 0.0),
+                'Rebuy Revenue': sum(columns.get('rebuy_revenue', []), 0.0),
+                'Total Revenue': sum(columns.get('total_revenue', []), 0.0),
+                # Team running metrics are the average of individual running metrics
+                'Average Deal Size': column_average('running_average_deal_size'),
+                'Appointments Booked': sum(columns.get('appointments_booked', [])),
+                'Appointments Conducted': sum(columns.get('appointments_conducted', [])),
+                'Daily Show Percentage': column_average('running_show_percentage'),
+                'Running Close Rate': column_average('running_close_rate'),
+            }
         }
-        
-        # Sum up metrics from all reps for yesterday
-        for rep in daily_metrics_by_rep:
-            if date_str in daily_metrics_by_rep[rep]:
-                metrics = daily_metrics_by_rep[rep][date_str]
-                team_totals[date_str]['New Clients Closed'] += metrics['new_clients_closed']
-                team_totals[date_str]['New Clients Closed (Organic)'] += metrics['new_clients_closed_organic']
-                team_totals[date_str]['Total New Clients Closed'] += metrics['total_new_clients_closed']
-                team_totals[date_str]['Total Rebuys'] += metrics['total_rebuys']
-                team_totals[date_str]['New Client Revenue'] += metrics['new_client_revenue']
-                team_totals[date_str]['Rebuy Revenue'] += metrics['rebuy_revenue']
-                team_totals[date_str]['Total Revenue'] += metrics['total_revenue']
-                team_totals[date_str]['Appointments Booked'] += metrics['appointments_booked']
-                team_totals[date_str]['Appointments Conducted'] += metrics['appointments_conducted']
-        
-        # Calculate team averages
-        total_new_clients = team_totals[date_str]['Total New Clients Closed']
-        total_new_revenue = team_totals[date_str]['New Client Revenue']
-        total_appointments_booked = team_totals[date_str]['Appointments Booked']
-        total_appointments_conducted = team_totals[date_str]['Appointments Conducted']
-        
-        team_totals[date_str]['Average Deal Size'] = (total_new_revenue / total_new_clients) if total_new_clients > 0 else 0.0
-        team_totals[date_str]['Daily Show Percentage'] = (total_appointments_conducted / total_appointments_booked * 100) if total_appointments_booked > 0 else 0.0
-        
-        # Calculate team running metrics (average of individual running metrics)
-        total_running_close_rate = sum(daily_metrics_by_rep[rep][date_str]['running_close_rate'] for rep in daily_metrics_by_rep if date_str in daily_metrics_by_rep[rep])
-        total_running_show_percentage = sum(daily_metrics_by_rep[rep][date_str]['running_show_percentage'] for rep in daily_metrics_by_rep if date_str in daily_metrics_by_rep[rep])
-        total_running_deal_size = sum(daily_metrics_by_rep[rep][date_str]['running_average_deal_size'] for rep in daily_metrics_by_rep if date_str in daily_metrics_by_rep[rep])
-        reps_with_data = len([rep for rep in daily_metrics_by_rep if date_str in daily_metrics_by_rep[rep]])
-        
-        team_totals[date_str]['Running Close Rate'] = (total_running_close_rate / reps_with_data) if reps_with_data > 0 else 0.0
-        team_totals[date_str]['Daily Show Percentage'] = (total_running_show_percentage / reps_with_data) if reps_with_data > 0 else 0.0
-        team_totals[date_str]['Average Deal Size'] = (total_running_deal_size / reps_with_data) if reps_with_data > 0 else 0.0
 
         # Add team totals to the results
         daily_metrics_by_rep['TEAM_TOTALS'] = team_totals
@@ -2723,65 +3243,36 @@ def analyze_sales_data_by_date():
         return {}
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
-        import traceback
         traceback.print_exc()
         return {}
 
 
 def analyze_sales_data():
     """Analyze sales data from Google Sheets"""
-    print("\n" + "=" * 80)
+    print("\n" + SECTION_SEPARATOR)
     print("PROCESSING SALES DATA...")
-    print("=" * 80)
+    print(SECTION_SEPARATOR)
 
     try:
-        # Get all sheets information
-        spreadsheet_metadata = (
-            service.spreadsheets()
-            .get(spreadsheetId=SPREADSHEET_ID, fields="sheets.properties")
-            .execute()
-        )
-        sheets = spreadsheet_metadata.get("sheets", [])
-
-        if not sheets:
-            print("No sheets found in this spreadsheet.")
-            return {}
-
-        # Get the latest sheet based on date parsing
-        latest_sheet_info = get_latest_sheet(sheets)
+        # Get the latest sheet and its data (shared across analyses for a few minutes)
+        latest_sheet_title, values = fetch_latest_sales_sheet()
 
-        if not latest_sheet_info:
-            print("Could not determine the latest sheet.")
+        if latest_sheet_title is None:
             return {}
 
-        latest_sheet_title = latest_sheet_info["properties"]["title"]
-
-        # Fetch data from the latest sheet
-        latest_sheet_range = f"'{latest_sheet_title}'!A1:Z"
-        result = (
-            sheet.values()
-            .get(spreadsheetId=SPREADSHEET_ID, range=latest_sheet_range)
-            .execute()
-        )
-        values = result.get("values", [])
-
         if not values:
             print(f"No data found in sheet '{latest_sheet_title}'.")
             return {}
 
         print(f"\nProcessing data from: '{latest_sheet_title}'")
 
-        # Convert to DataFrame for easier processing
-        max_cols = max(len(row) for row in values) if values else 0
-        padded_values = [row + [""] * (max_cols - len(row)) for row in values]
-
-        # Create DataFrame with first row as headers
-        df = pd.DataFrame(padded_values[1:], columns=padded_values[0])
+        # Convert to DataFrame for easier processing (first row as headers)
+        df = sheet_values_to_dataframe(values)
 
         print(f"Total records: {len(df)}")
 
         # Check if required columns exist and map them
-        required_columns = ["Demo By", "ORGANIC?", "REBUY?", "Deal Amount"]
+        required_columns = SALES_REQUIRED_COLUMNS
         column_mapping = map_required_columns(df, required_columns)
 
         missing_columns = [
@@ -2807,258 +3298,182 @@ def analyze_sales_data():
         print(f"Users: {', '.join(all_users)}")
 
         # Parse Deal Amount column
-        df["Deal Amount Parsed"] = df[deal_amount_col].apply(
-            parse_currency_value
-        )
+        df["Deal Amount Parsed"] = parse_currency_series(df[deal_amount_col])
+
+        # Empty/has-value masks, computed once per column
+        organic_empty = empty_mask(df[organic_col])
+        rebuy_empty = empty_mask(df[rebuy_col])
 
         # 1. NEW CLIENTS CLOSED (both ORGANIC? and REBUY? are empty)
-        new_clients_df = df[
-            df[organic_col].apply(is_empty_or_null)
-            & df[rebuy_col].apply(is_empty_or_null)
-        ]
+        new_mask = organic_empty & rebuy_empty
 
         # 2. NEW CLIENTS CLOSED (ORGANIC) (ORGANIC? has value, REBUY? is empty)
-        organic_clients_df = df[
-            df[organic_col].apply(has_value)
-            & df[rebuy_col].apply(is_empty_or_null)
-        ]
-
-        # 3. REBUY CLIENTS (REBUY? has value)
-        rebuy_clients_df = df[df[rebuy_col].apply(has_value)]
+        organic_mask = ~organic_empty & rebuy_empty
 
-        # 4. NEW CLIENT REVENUE (REBUY? is empty)
-        new_client_revenue_df = df[df[rebuy_col].apply(is_empty_or_null)]
+        # 3. REBUY CLIENTS / 5. REBUY REVENUE (REBUY? has value)
+        rebuy_mask = ~rebuy_empty
 
-        # 5. REBUY REVENUE (REBUY? has value)
-        rebuy_revenue_df = df[df[rebuy_col].apply(has_value)]
+        # 4. NEW CLIENT REVENUE (REBUY? is empty) uses rebuy_empty
 
         print(f"\nData Analysis:")
         print(
-            f"Records with both ORGANIC? and REBUY? empty (New Clients): {len(new_clients_df)}"
+            f"Records with both ORGANIC? and REBUY? empty (New Clients): {int(new_mask.sum())}"
         )
         print(
-            f"Records with ORGANIC? value and REBUY? empty (Organic Clients): {len(organic_clients_df)}"
+            f"Records with ORGANIC? value and REBUY? empty (Organic Clients): {int(organic_mask.sum())}"
         )
         print(
-            f"Records with REBUY? value (Rebuy Clients): {len(rebuy_clients_df)}"
+            f"Records with REBUY? value (Rebuy Clients): {int(rebuy_mask.sum())}"
         )
         print(
-            f"Records with REBUY? empty (New Client Revenue): {len(new_client_revenue_df)}"
+            f"Records with REBUY? empty (New Client Revenue): {int(rebuy_empty.sum())}"
         )
         print(
-            f"Records with REBUY? value (Rebuy Revenue): {len(rebuy_revenue_df)}"
+            f"Records with REBUY? value (Rebuy Revenue): {int(rebuy_mask.sum())}"
+        )
+
+        # Per-rep counts and revenue for every category in one groupby pass;
+        # results are only read by key, so skip sorting the group labels
+        deal_amounts = df["Deal Amount Parsed"]
+        per_rep = pd.DataFrame(
+            {
+                "new": new_mask,
+                "organic": organic_mask,
+                "rebuy": rebuy_mask,
+                "new_revenue_rows": rebuy_empty,
+                "new_revenue": deal_amounts.where(rebuy_empty, 0.0),
+                "rebuy_revenue": deal_amounts.where(rebuy_mask, 0.0),
+            }
+        ).groupby(df[demo_by_col], sort=False).sum()
+
+        # Keep only reps that have rows in each category, as the per-slice
+        # value_counts()/groupby() used to
+        has_new = per_rep["new"] > 0
+        has_organic = per_rep["organic"] > 0
+        has_rebuy = per_rep["rebuy"] > 0
+        has_new_revenue = per_rep["new_revenue_rows"] > 0
+
+        # Per canonical rep, summed over that rep's exact name variants
+        rep_totals = (
+            per_rep.groupby(per_rep.index.map(SALES_NAME_VARIANT_TO_REP))
+            .sum()
+            .reindex(list(SALES_REP_NAME_VARIANTS), fill_value=0)
         )
 
-        # Process and send metrics to Slack
+        # Process metrics; their Slack messages are sent together at the end
+        slack_messages = []
 
         # 1. New Clients Closed
-        if len(new_clients_df) > 0:
-            new_clients_counts = (
-                new_clients_df[demo_by_col].value_counts().to_dict()
-            )
-        else:
-            new_clients_counts = {}
+        new_clients_counts = per_rep.loc[has_new, "new"].to_dict()
 
         # Store metrics for each rep
-        for rep in ['sierra', 'mikaela', 'mike']:
-            # Map rep names to sheet names
-            rep_mapping = {
-                'sierra': ['sierra', 'sierra campbell', 'sierrac'],
-                'mikaela': ['mikaela', 'mikaela gordon'],
-                'mike': ['mike', 'mike hammer', 'hammer']
-            }
-
-            # Find matching name in data
-            count = 0
-            for name_variant in rep_mapping.get(rep, [rep]):
-                count += new_clients_counts.get(name_variant, 0)
-
+        for rep, count in rep_totals["new"].items():
             store_metric(rep, "calculated_new_clients_closed", count, "count", "Google Sheets")
 
-        slack_message = create_slack_message(
+        slack_messages.append(create_slack_message(
             new_clients_counts,
             all_users,
             latest_sheet_title,
             "NEW CLIENTS CLOSED (CALCULATED)",
-        )
-        broadcast_to_slack_users(slack_message)
+        ))
 
         # 2. Organic Clients Closed
-        if len(organic_clients_df) > 0:
-            organic_clients_counts = (
-                organic_clients_df[demo_by_col].value_counts().to_dict()
-            )
-        else:
-            organic_clients_counts = {}
+        organic_clients_counts = per_rep.loc[has_organic, "organic"].to_dict()
 
         # Store metrics for each rep
-        for rep in ['sierra', 'mikaela', 'mike']:
-            rep_mapping = {
-                'sierra': ['sierra', 'sierra campbell', 'sierrac'],
-                'mikaela': ['mikaela', 'mikaela gordon'],
-                'mike': ['mike', 'mike hammer', 'hammer']
-            }
-
-            count = 0
-            for name_variant in rep_mapping.get(rep, [rep]):
-                count += organic_clients_counts.get(name_variant, 0)
-
+        for rep, count in rep_totals["organic"].items():
             store_metric(rep, "calculated_organic_clients_closed", count, "count", "Google Sheets")
 
-        slack_message = create_slack_message(
+        slack_messages.append(create_slack_message(
             organic_clients_counts,
             all_users,
             latest_sheet_title,
             "NEW CLIENTS CLOSED (ORGANIC) - CALCULATED",
-        )
-        broadcast_to_slack_users(slack_message)
+        ))
 
         # 3. Rebuy Clients
-        if len(rebuy_clients_df) > 0:
-            rebuy_clients_counts = (
-                rebuy_clients_df[demo_by_col].value_counts().to_dict()
-            )
-        else:
-            rebuy_clients_counts = {}
+        rebuy_clients_counts = per_rep.loc[has_rebuy, "rebuy"].to_dict()
 
         # Store metrics for each rep
-        for rep in ['sierra', 'mikaela', 'mike']:
-            rep_mapping = {
-                'sierra': ['sierra', 'sierra campbell', 'sierrac'],
-                'mikaela': ['mikaela', 'mikaela gordon'],
-                'mike': ['mike', 'mike hammer', 'hammer']
-            }
-
-            count = 0
-            for name_variant in rep_mapping.get(rep, [rep]):
-                count += rebuy_clients_counts.get(name_variant, 0)
-
+        for rep, count in rep_totals["rebuy"].items():
             store_metric(rep, "calculated_rebuy_clients", count, "count", "Google Sheets")
 
-        slack_message = create_slack_message(
+        slack_messages.append(create_slack_message(
             rebuy_clients_counts,
             all_users,
             latest_sheet_title,
             "REBUY CLIENTS (CALCULATED)",
-        )
-        broadcast_to_slack_users(slack_message)
+        ))
 
         # 4. New Client Revenue
-        if len(new_client_revenue_df) > 0:
-            new_client_revenue_grouped = (
-                new_client_revenue_df.groupby(demo_by_col)[
-                    "Deal Amount Parsed"
-                ]
-                .sum()
-                .to_dict()
-            )
-        else:
-            new_client_revenue_grouped = {}
+        new_client_revenue_grouped = per_rep.loc[has_new_revenue, "new_revenue"].to_dict()
 
         # Store metrics for each rep
-        for rep in ['sierra', 'mikaela', 'mike']:
-            rep_mapping = {
-                'sierra': ['sierra', 'sierra campbell', 'sierrac'],
-                'mikaela': ['mikaela', 'mikaela gordon'],
-                'mike': ['mike', 'mike hammer', 'hammer']
-            }
-
-            revenue = 0.0
-            for name_variant in rep_mapping.get(rep, [rep]):
-                revenue += new_client_revenue_grouped.get(name_variant, 0.0)
-
+        for rep, revenue in rep_totals["new_revenue"].items():
             store_metric(rep, "calculated_new_client_revenue", revenue, "currency", "Google Sheets")
 
-        slack_message = create_slack_message(
+        slack_messages.append(create_slack_message(
             new_client_revenue_grouped,
             all_users,
             latest_sheet_title,
             "NEW CLIENT REVENUE (CALCULATED)",
             is_revenue=True,
-        )
-        broadcast_to_slack_users(slack_message)
+        ))
 
         # 5. Total New Clients Closed
-        total_new_clients = {
-            rep: new_clients_counts.get(rep, 0)
-            + organic_clients_counts.get(rep, 0)
-            for rep in all_users
-        }
+        total_new_clients = (
+            (per_rep["new"] + per_rep["organic"])
+            .reindex(all_users, fill_value=0)
+            .to_dict()
+        )
 
-        slack_message = create_slack_message(
+        slack_messages.append(create_slack_message(
             total_new_clients,
             all_users,
             latest_sheet_title,
             "TOTAL NEW CLIENTS CLOSED (CALCULATED)",
-        )
-        broadcast_to_slack_users(slack_message)
+        ))
 
         # 6. Rebuy Revenue
-        if len(rebuy_revenue_df) > 0:
-            rebuy_revenue_grouped = (
-                rebuy_revenue_df.groupby(demo_by_col)["Deal Amount Parsed"]
-                .sum()
-                .to_dict()
-            )
-        else:
-            rebuy_revenue_grouped = {}
+        rebuy_revenue_grouped = per_rep.loc[has_rebuy, "rebuy_revenue"].to_dict()
 
         # Store metrics for each rep
-        for rep in ['sierra', 'mikaela', 'mike']:
-            rep_mapping = {
-                'sierra': ['sierra', 'sierra campbell', 'sierrac'],
-                'mikaela': ['mikaela', 'mikaela gordon'],
-                'mike': ['mike', 'mike hammer', 'hammer']
-            }
-
-            revenue = 0.0
-            for name_variant in rep_mapping.get(rep, [rep]):
-                revenue += rebuy_revenue_grouped.get(name_variant, 0.0)
-
+        for rep, revenue in rep_totals["rebuy_revenue"].items():
             store_metric(rep, "calculated_rebuy_revenue", revenue, "currency", "Google Sheets")
 
-        slack_message = create_slack_message(
+        slack_messages.append(create_slack_message(
             rebuy_revenue_grouped,
             all_users,
             latest_sheet_title,
             "REBUY REVENUE (CALCULATED)",
             is_revenue=True,
-        )
-        broadcast_to_slack_users(slack_message)
+        ))
 
         # 7. Total Revenue
-        total_revenue_dict = {}
-        for user in all_users:
-            new_revenue = new_client_revenue_grouped.get(user, 0.0)
-            rebuy_revenue = rebuy_revenue_grouped.get(user, 0.0)
-            total_revenue_dict[user] = new_revenue + rebuy_revenue
+        total_revenue_dict = (
+            (per_rep["new_revenue"] + per_rep["rebuy_revenue"])
+            .reindex(all_users, fill_value=0.0)
+            .to_dict()
+        )
 
         # Store metrics for each rep
-        for rep in ['sierra', 'mikaela', 'mike']:
-            rep_mapping = {
-                'sierra': ['sierra', 'sierra campbell', 'sierrac'],
-                'mikaela': ['mikaela', 'mikaela gordon'],
-                'mike': ['mike', 'mike hammer', 'hammer']
-            }
-
-            total_revenue = 0.0
-            for name_variant in rep_mapping.get(rep, [rep]):
-                total_revenue += total_revenue_dict.get(name_variant, 0.0)
-
+        rep_total_revenue = rep_totals["new_revenue"] + rep_totals["rebuy_revenue"]
+        for rep, total_revenue in rep_total_revenue.items():
             store_metric(rep, "calculated_total_revenue", total_revenue, "currency", "Google Sheets")
 
-        slack_message = create_slack_message(
+        slack_messages.append(create_slack_message(
             total_revenue_dict,
             all_users,
             latest_sheet_title,
             "TOTAL REVENUE (CALCULATED)",
             is_revenue=True,
-        )
-        broadcast_to_slack_users(slack_message)
+        ))
+
+        broadcast_to_slack_users(*slack_messages)
 
-        # Store global variables for running close rate calculation
-        globals()["new_clients_counts"] = new_clients_counts
-        globals()["new_client_revenue_grouped"] = new_client_revenue_grouped
+        # Keep for later close-rate and deal-size calculations
+        run_state["new_clients_counts"] = new_clients_counts
+        run_state["new_client_revenue_grouped"] = new_client_revenue_grouped
 
         # Return processed data for database storage
         return {
@@ -3075,7 +3490,6 @@ def analyze_sales_data():
         return {}
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
-        import traceback
         traceback.print_exc()
         return {}
 
@@ -3097,9 +3511,11 @@ def send_master_sheet_metric_messages():
         ("master_average_deal_size", "Average Deal Size (Master Sheet)", "currency"),
     ]
     
-    for metric_name, display_name, metric_type in master_metrics_to_send:
-        message = create_metric_slack_message(metric_name, display_name, metric_type)
-        broadcast_to_slack_users(message)
+    yesterday = get_yesterday_est()
+    broadcast_to_slack_users(*(
+        create_metric_slack_message(metric_name, display_name, metric_type, yesterday)
+        for metric_name, display_name, metric_type in master_metrics_to_send
+    ))
 
 
 def save_daily_sales_metrics_to_csv(daily_sales_data):
@@ -3116,17 +3532,17 @@ def save_daily_sales_metrics_to_csv(daily_sales_data):
     current_year = daily_sales_data.get('current_year', 'Unknown')
     all_dates = daily_sales_data.get('all_dates', [])
     
+    # Format each date once instead of once per rep
+    date_strs = [date.strftime('%Y-%m-%d') for date in all_dates]
+    
     # Process each rep for each date (ensuring all dates are included for all reps)
     for rep_name in ['sierra', 'mikaela', 'mike']:
         rep_data = daily_metrics.get(rep_name, {})
         
-        for date in all_dates:
-            date_str = date.strftime('%Y-%m-%d')
-            
+        for date_str in date_strs:
             # Get metrics for this date, or use zeros if no data
-            if date_str in rep_data:
-                metrics = rep_data[date_str]
-            else:
+            metrics = rep_data.get(date_str)
+            if metrics is None:
                 # Create zero metrics for dates with no data
                 metrics = {
                     'new_clients_closed': 0,
@@ -3163,11 +3579,9 @@ def save_daily_sales_metrics_to_csv(daily_sales_data):
     
     # Add team totals for each date
     team_totals = daily_metrics.get('TEAM_TOTALS', {})
-    for date in all_dates:
-        date_str = date.strftime('%Y-%m-%d')
-        
-        if date_str in team_totals:
-            metrics = team_totals[date_str]
+    for date_str in date_strs:
+        metrics = team_totals.get(date_str)
+        if metrics is not None:
             record = {
                 'Date': date_str,
                 'Representative': 'Team Totals',
@@ -3216,18 +3630,8 @@ def extract_attendees_from_transcript(transcript_content):
     attendee_names = []
     
     # Look for patterns like "John Doe joined the meeting" or "Jane Smith left the meeting"
-    import re
-    
-    # Pattern to match names in join/leave messages
-    join_patterns = [
-        r"(\w+(?:\s+\w+)*)\s+joined\s+the\s+meeting",
-        r"(\w+(?:\s+\w+)*)\s+left\s+the\s+meeting",
-        r"(\w+(?:\s+\w+)*)\s+has\s+joined\s+the\s+meeting",
-        r"(\w+(?:\s+\w+)*)\s+has\s+left\s+the\s+meeting"
-    ]
-    
-    for pattern in join_patterns:
-        matches = re.findall(pattern, transcript_content, re.IGNORECASE)
+    for pattern in _JOIN_LEAVE_RES:
+        matches = pattern.findall(transcript_content)
         for match in matches:
             name = match.strip()
             # Filter out common system messages and sales rep names
@@ -3313,7 +3717,6 @@ def main():
 
     except Exception as e:
         print(f"Error during analysis: {e}")
-        import traceback
         traceback.print_exc()
 
 